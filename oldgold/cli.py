@@ -2,7 +2,27 @@
 from __future__ import annotations
 
 import argparse
-from typing import List
+import importlib
+from typing import Callable, Dict, List
+
+# Command modules are imported lazily on first dispatch and then cached, so
+# repeated dispatches in one interpreter (e.g. batch pool workers) are a
+# dict lookup rather than a re-executed import statement.
+_COMMAND_MODULES = {
+    "scan": ".scanner.scan",
+    "probe": ".tax.probe",
+    "simulate": ".sim.simulate",
+    "run-one": ".exec.run_one",
+}
+_DISPATCH: Dict[str, Callable] = {}
+
+
+def _get_command(cmd: str) -> Callable:
+    fn = _DISPATCH.get(cmd)
+    if fn is None:
+        mod = importlib.import_module(_COMMAND_MODULES[cmd], package=__package__)
+        fn = _DISPATCH[cmd] = mod.main
+    return fn
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -18,6 +38,7 @@ def build_parser() -> argparse.ArgumentParser:
     probe_p.add_argument("--dust", type=float, default=0.0002)
     probe_p.add_argument("--dry-run", action="store_true")
     probe_p.add_argument("--force-probe", action="store_true")
+    probe_p.add_argument("--live", action="store_true")
 
     sim_p = sub.add_parser("simulate")
     sim_p.add_argument("--stale-rin", type=float, required=True)
@@ -49,47 +70,12 @@ def build_parser() -> argparse.ArgumentParser:
 def main(argv: List[str] | None = None) -> int:
     p = build_parser()
     args = p.parse_args(argv)
-    if args.cmd == "scan":
-        from .scanner.scan import main as scan_main
-
-        scan_main(network=args.network)
-    elif args.cmd == "probe":
-        from .tax.probe import main as probe_main
-
-        probe_main(chain=args.chain, token=args.token, dust=args.dust, dry_run=args.dry_run, force_probe=args.force_probe)
-    elif args.cmd == "simulate":
-        from .sim.simulate import main as sim_main
-
-        sim_main(
-            stale_rin=args.stale_rin,
-            stale_rout=args.stale_rout,
-            fee=args.fee,
-            active_rin=args.active_rin,
-            active_rout=args.active_rout,
-            buy_tax=args.buy_tax,
-            sell_tax=args.sell_tax,
-            gas_base=args.gas_base,
-            slip_bps=args.slip_bps,
-            grid=args.grid,
-        )
-    elif args.cmd == "run-one":
-        from .exec.run_one import main as run_one_main
-
-        run_one_main(
-            chain=args.chain,
-            token=args.token,
-            base=args.base,
-            stale_pair=args.stale_pair,
-            active_pair=args.active_pair,
-            fee=args.fee,
-            slip_bps=args.slip_bps,
-            grid=args.grid,
-            dry_run=args.dry_run,
-            force_probe=args.force_probe,
-        )
-    else:
+    if args.cmd not in _COMMAND_MODULES:
         p.print_help()
         return 1
+    # each subparser's options mirror its main() signature exactly
+    kwargs = {k: v for k, v in vars(args).items() if k != "cmd"}
+    _get_command(args.cmd)(**kwargs)
     return 0
 
 
@@ -1,14 +1,14 @@
 TOKENS_BY_CHAIN = {
     "eth": {
-        "WETH": "0xC02aaA39b223FE8D0A0e5C4f27eAD9083C756Cc2",
-        "USDC": "0xA0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
+        "WETH": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+        "USDC": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
         "USDT": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
         "DAI": "0x6B175474E89094C44Da98b954EedeAC495271d0F",
     },
     "bsc": {
-        "WBNB": "0xBB4CdB9CBd36B01bD1cBaEBF2De08d9173bc095c",
+        "WBNB": "0xbb4CdB9CBd36B01bD1cBaEBF2De08d9173bc095c",
         "USDT": "0x55d398326f99059fF775485246999027B3197955",
-        "BUSD": "0xe9e7cea3dedca5984780bafc599bd69add087d56",
+        "BUSD": "0xe9e7CEA3DedcA5984780Bafc599bD69ADd087D56",
     },
 }
 
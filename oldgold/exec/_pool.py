@@ -0,0 +1,38 @@
+"""Shared process pool for `oldgold.exec` entry points.
+
+Back-to-back sub-commands (discover -> batch_probe -> run-one) in one script
+should not each fork their own workers; the pool is created lazily on first
+use and reused for the life of the process.
+"""
+from __future__ import annotations
+
+import atexit
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+_POOL: ProcessPoolExecutor | None = None
+
+
+def _init_worker() -> None:
+    """Pay the heavy per-worker costs (web3 import tree, .env parse) once."""
+    from ..config import _env
+
+    _env()
+    from . import run_one  # noqa: F401
+
+
+def _shutdown() -> None:
+    if _POOL is not None:
+        _POOL.shutdown(wait=True)
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Return the lazily created, process-wide executor (OG_WORKERS wide)."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(
+            max_workers=int(os.getenv("OG_WORKERS", os.cpu_count() or 1)),
+            initializer=_init_worker,
+        )
+        atexit.register(_shutdown)
+    return _POOL
@@ -1,31 +1,78 @@
-import json, subprocess, sys, time
-
-
-def run(tokens):
-    outs = []
-    for t in tokens:
-        print("==>", t)
-        cp = subprocess.run([
-            "oldgold",
-            "run-one",
-            "--chain",
-            "bsc",
-            "--token",
-            t,
-            "--base",
-            "WBNB",
-            "--grid",
-            "1e3,5e3,1e4",
-            "--slip-bps",
-            "20",
-        ], capture_output=True, text=True)
-        print(cp.stdout)
-        for line in cp.stdout.splitlines():
-            if line.startswith('{"oldgold_summary"'):
-                outs.append(json.loads(line)["oldgold_summary"])
-                break
-        time.sleep(1.0)
-    json.dump(outs, open("out/batch_summary.json", "w"), indent=2)
+"""Batch runner: fan `run-one` out over a persistent process pool.
+
+Previously each token shelled out a fresh ``oldgold run-one`` subprocess,
+paying interpreter startup plus the web3/dotenv import tree every time and
+sleeping 1s between tokens.  Running `run_one.main` in pool workers pays the
+import cost once per worker and lets the I/O-bound token runs overlap.
+"""
+from __future__ import annotations
+
+import os
+import sys
+from concurrent.futures import as_completed
+from pathlib import Path
+from typing import Dict, List
+
+from ..logging_conf import LOGGER
+from ..utils import save_json
+from ._pool import get_pool
+
+
+def _run_one_subprocess(token: str) -> Dict | None:
+    """Fallback: run one token in a fully isolated ``oldgold run-one`` subprocess.
+
+    Streams the child's stdout line by line instead of buffering it whole, and
+    stops reading as soon as the summary marker arrives so chatty children do
+    not accumulate in memory.  Enabled with OG_BATCH_SUBPROCESS=1.
+    """
+    import json
+    import subprocess
+
+    proc = subprocess.Popen(
+        ["oldgold", "run-one", "--chain", "bsc", "--token", token,
+         "--base", "WBNB", "--grid", "1e3,5e3,1e4", "--slip-bps", "20"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    summary = None
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        if line.startswith('{"oldgold_summary"'):
+            summary = json.loads(line)["oldgold_summary"]
+            break
+    proc.stdout.close()
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        # the summary is already in hand; a child lingering on the closed
+        # pipe gets killed rather than leaking or failing the future
+        LOGGER.warning("run-one child for %s outlived its summary; killing", token)
+        proc.kill()
+        proc.wait()
+    return summary
+
+
+def run(tokens: List[str]) -> None:
+    if os.getenv("OG_BATCH_SUBPROCESS") == "1":
+        ex = get_pool()
+        futures = {ex.submit(_run_one_subprocess, t): t for t in tokens}
+        outs: List[Dict] = []
+        for fut in as_completed(futures):
+            token = futures[fut]
+            summary = fut.result()
+            LOGGER.info("==> %s %s", token, "ok" if summary else "failed")
+            if summary:
+                outs.append(summary)
+    else:
+        from .run_one import run_many
+
+        outs = run_many(
+            tokens, chain="bsc", base="WBNB", grid="1e3,5e3,1e4", slip_bps=20.0
+        )
+    Path("out").mkdir(exist_ok=True)
+    save_json("out/batch_summary.json", outs)
 
 
 if __name__ == "__main__":
@@ -5,19 +5,19 @@ Steps:
   - Take top N rows
   - For each: live tax probe (dust buy & sell)
   - Simulate with taxes + gas, produce GO/NO-GO summary
-Output: out/ranked_<timestamp>.json
+Output: out/ranked_<timestamp>.jsonl (line-delimited, written incrementally)
 """
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict
 
 from ..logging_conf import LOGGER
-from ..utils import save_json
+from ..utils import append_jsonl, load_json
 from ..tax.probe import main as probe_main
 from .run_one import run_sim
 from .run_one import estimate_gas_base  # reuse your function
@@ -25,9 +25,20 @@ from .run_one import estimate_gas_base  # reuse your function
 MIN_PNL = float(os.getenv("MIN_PNL_BASE", "0.002"))
 MAX_TAX_BUY = float(os.getenv("MAX_TAX_BUY", "0.15"))
 MAX_TAX_SELL = float(os.getenv("MAX_TAX_SELL", "0.15"))
+PROBE_WORKERS = int(os.getenv("OG_PROBE_WORKERS", "8"))
+
+
+def _safe_probe(chain: str, token: str, dust: float) -> Dict:
+    """Run a live tax probe, mapping failures to a conservative result."""
+    LOGGER.info("Probing %s", token)
+    try:
+        return probe_main(chain=chain, token=token, dust=dust) or {}
+    except SystemExit as se:
+        LOGGER.warning("probe skipped %s: %s", token, se)
+        return {"buy_tax_est": 0.0, "sell_tax_est": 0.0, "honeypot_buy": True, "honeypot_sell": True}
 
 def load_rows(path: str) -> List[Dict]:
-    return json.loads(Path(path).read_text())
+    return load_json(path)
 
 def decide(pnl: float, buy_tax: float, sell_tax: float, honeypots: tuple[bool,bool]) -> tuple[str, List[str]]:
     reasons: List[str] = []
@@ -55,41 +66,44 @@ def main() -> None:
     args = p.parse_args()
 
     rows = load_rows(args.infile)[: args.top]
+    # rows are streamed to JSONL as they complete, so an interrupted run
+    # keeps its progress; out_rows only feeds the summary table below
     out_rows: List[Dict] = []
+    Path("out").mkdir(exist_ok=True)
+    out_file = Path("out") / f"ranked_{int(time.time())}.jsonl"
 
     gas_base = estimate_gas_base(args.chain)
 
-    for r in rows:
-        token = r["token"]
-        LOGGER.info("Probing %s", token)
-        try:
-            probe = probe_main(chain=args.chain, token=token, dust=args.dust) or {}
-        except SystemExit as se:
-            LOGGER.warning("probe skipped %s: %s", token, se)
-            probe = {"buy_tax_est": 0.0, "sell_tax_est": 0.0, "honeypot_buy": True, "honeypot_sell": True}
-
-        buy_tax = float(probe.get("buy_tax_est", 0.0) or 0.0)
-        sell_tax = float(probe.get("sell_tax_est", 0.0) or 0.0)
-        hp_buy = bool(probe.get("honeypot_buy", False))
-        hp_sell = bool(probe.get("honeypot_sell", False))
-
-        sim = run_sim(
-            stale_rin=r["stale_rin"],
-            stale_rout=r["stale_rout"],
-            active_rin=r["active_rin"],
-            active_rout=r["active_rout"],
-            fee=args.fee,
-            slip_bps=args.slip_bps,
-            grid=args.grid,
-            buy_tax=buy_tax,
-            sell_tax=sell_tax,
-            gas_base=gas_base,
-        )
-
-        decision, reasons = decide(sim["best"]["pnl"], buy_tax, sell_tax, (hp_buy, hp_sell))
-
-        out_rows.append(
-            {
+    # probes are RPC-latency-bound, so overlap them; the cheap run_sim/decide
+    # steps run inside the loop as each probe lands, so every finished row
+    # hits the JSONL before the slowest probe (or an interruption) resolves
+    with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as ex:
+        futures = {ex.submit(_safe_probe, args.chain, r["token"], args.dust): r for r in rows}
+        for fut in as_completed(futures):
+            r = futures[fut]
+            probe = fut.result()
+            token = r["token"]
+            buy_tax = float(probe.get("buy_tax_est", 0.0) or 0.0)
+            sell_tax = float(probe.get("sell_tax_est", 0.0) or 0.0)
+            hp_buy = bool(probe.get("honeypot_buy", False))
+            hp_sell = bool(probe.get("honeypot_sell", False))
+
+            sim = run_sim(
+                stale_rin=r["stale_rin"],
+                stale_rout=r["stale_rout"],
+                active_rin=r["active_rin"],
+                active_rout=r["active_rout"],
+                fee=args.fee,
+                slip_bps=args.slip_bps,
+                grid=args.grid,
+                buy_tax=buy_tax,
+                sell_tax=sell_tax,
+                gas_base=gas_base,
+            )
+
+            decision, reasons = decide(sim["best"]["pnl"], buy_tax, sell_tax, (hp_buy, hp_sell))
+
+            row = {
                 "token": token,
                 "stale_pair": r["stale_pair"],
                 "active_pair": r["active_pair"],
@@ -104,12 +118,10 @@ def main() -> None:
                 "decision": decision,
                 "reasons": reasons,
             }
-        )
+            append_jsonl(out_file, row)
+            out_rows.append(row)
 
-    Path("out").mkdir(exist_ok=True)
-    out_file = Path("out") / f"ranked_{int(time.time())}.json"
-    save_json(out_file, out_rows)
-    LOGGER.info("wrote %s", out_file)
+    LOGGER.info("wrote %s (%d rows)", out_file, len(out_rows))
     # print short table
     for row in out_rows:
         LOGGER.info("%s  edge=%.1f bps  pnl=%.6f  taxes=(%.2f/%.2f)  %s %s",
@@ -11,22 +11,34 @@ Outputs: out/discover_<chain>_<base>.json
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import math
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Dict
+from typing import Iterable, List, Dict, Optional
 
+import requests
 from web3 import Web3
+from web3.exceptions import Web3Exception
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None
 
 from ..config import CHAIN_CONFIGS
 from ..logging_conf import LOGGER
 from ..utils import save_json
 from ..sim.v2_math import amount_out_v2, buy_cost_on_active_pool
-from ..scanner.pairs import get_pair, active_pool_for_token
+from ..scanner.pairs import get_pair_or_none, active_pool_for_token
 
 # Local gas estimate (same idea as run_one)
 APPROVE_GAS = int(os.getenv("GAS_UNITS_APPROVE", "50000"))
 SWAP_GAS = int(os.getenv("GAS_UNITS_SWAP", "200000"))
+TOTAL_GAS_UNITS = APPROVE_GAS + 2 * SWAP_GAS
 
 PAIR_ABI = json.loads(
     """[
@@ -36,8 +48,37 @@ PAIR_ABI = json.loads(
     ]"""
 )
 
+# One Web3 per (thread, chain): HTTPProvider wraps a requests.Session whose
+# urllib3 pool is not safe to share across threads.
+_LOCAL = threading.local()
+
+# Thread-pool width for the per-token RPC fan-out; the work is latency-bound
+# so threads overlap the round-trips.
+MAX_WORKERS = int(os.getenv("OG_DISCOVER_WORKERS", "16"))
+
+
 def _w3(chain: str) -> Web3:
-    return Web3(Web3.HTTPProvider(CHAIN_CONFIGS[chain].rpc))
+    cache = getattr(_LOCAL, "w3", None)
+    if cache is None:
+        cache = _LOCAL.w3 = {}
+    w3 = cache.get(chain)
+    if w3 is None:
+        # explicit Session gives HTTP keep-alive across eth_calls on this thread
+        provider = Web3.HTTPProvider(CHAIN_CONFIGS[chain].rpc, session=requests.Session())
+        w3 = cache[chain] = Web3(provider)
+    return w3
+
+
+def _pair_contract(chain: str, pair_addr: str):
+    """Per-thread contract cache so repeated pairs skip ABI re-binding."""
+    cache = getattr(_LOCAL, "contracts", None)
+    if cache is None:
+        cache = _LOCAL.contracts = {}
+    key = (chain, pair_addr)
+    c = cache.get(key)
+    if c is None:
+        c = cache[key] = _w3(chain).eth.contract(address=_to_checksum(pair_addr), abi=PAIR_ABI)
+    return c
 
 
 def _estimate_gas_base(chain: str) -> float:
@@ -46,77 +87,133 @@ def _estimate_gas_base(chain: str) -> float:
         gp = w3.eth.gas_price
     except Exception:
         return 0.0
-    units = APPROVE_GAS + 2 * SWAP_GAS
-    return float(Web3.from_wei(gp * units, "ether"))
+    return (gp * TOTAL_GAS_UNITS) / 1e18
 
 
+@functools.lru_cache(maxsize=65536)
 def _to_checksum(addr: str) -> str:
+    # EIP-55 checksumming is a keccak per call; memoize since the same
+    # token/pair addresses recur across the scan
     return Web3.to_checksum_address(addr)
 
 
 def _reserves_from_pair_addr(chain: str, pair_addr: str, token_in: str) -> tuple[float, float]:
     """Read reserves for token_in -> other from a known pair address."""
-    w3 = _w3(chain)
-    c = w3.eth.contract(address=_to_checksum(pair_addr), abi=PAIR_ABI)
+    c = _pair_contract(chain, pair_addr)
     t0 = c.functions.token0().call()
-    _t1 = c.functions.token1().call()
     r0, r1, _ = c.functions.getReserves().call()
-    if _to_checksum(token_in) == _to_checksum(t0):
+    # web3 returns t0 checksummed already; a lowercase compare avoids
+    # re-hashing both sides
+    if token_in.lower() == t0.lower():
         return float(r0), float(r1)
     else:
         return float(r1), float(r0)
 
 
 def _load_tokens(tokens_file: str | None, tokens_csv: str | None) -> List[str]:
+    # dict.fromkeys dedups case-insensitively in one pass while preserving
+    # order — pasted token lists frequently overlap, and duplicates would
+    # multiply the RPC fan-out downstream
     if tokens_file:
         text = Path(tokens_file).read_text().strip()
-        addrs = [x.strip() for x in text.replace(",", "\n").splitlines() if x.strip()]
-        return addrs
+        return list(dict.fromkeys(x.strip().lower() for x in text.replace(",", "\n").splitlines() if x.strip()))
     if tokens_csv:
-        return [x.strip() for x in tokens_csv.split(",") if x.strip()]
+        return list(dict.fromkeys(x.strip().lower() for x in tokens_csv.split(",") if x.strip()))
     raise SystemExit("Provide --tokens-file or --tokens (comma-separated)")
 
 
-def discover(
+def _optimal_no_tax_size(
+    stale_rin: float,
+    stale_rout: float,
+    active_rin: float,
+    active_rout: float,
+    fee: float,
+) -> float:
+    """Closed-form optimal trade size for the no-tax two-pool arb.
+
+    Found by equating the marginal base-out on the stale pool with the
+    marginal base-in on the active pool:
+
+        x* = (k1*T - k2*R_in) / (k1 + (1-fee)*k2)
+
+    with k1 = (1-fee)*sqrt(R_in*R_out) over the stale reserves and
+    k2 = sqrt(B*T) over the active (token T, base B) reserves.  Returns a
+    non-positive value when no size is profitable.
+    """
+    one_minus_fee = 1.0 - fee
+    k1 = one_minus_fee * math.sqrt(stale_rin * stale_rout)
+    k2 = math.sqrt(active_rout * active_rin)
+    return (k1 * active_rin - k2 * stale_rin) / (k1 + one_minus_fee * k2)
+
+
+def _process_token(
     chain: str,
-    base: str,
-    tokens: Iterable[str],
+    token: str,
+    base_addr: str,
     min_edge_bps: float,
     fee: float,
     grid: List[float],
-    top: int,
-) -> List[Dict]:
-    cfg = CHAIN_CONFIGS[chain]
-    base_addr = base if base.lower().startswith("0x") else cfg.wrapped
-    base_addr = _to_checksum(base_addr)
-
-    gas_base_est = _estimate_gas_base(chain)
-    rows: List[Dict] = []
-
-    for token in tokens:
+    gas_base_est: float,
+) -> Optional[Dict]:
+    """Evaluate a single token; return a candidate row or None."""
+    try:
+        # stale (sell) reserves: token -> base; "no pair" is the common case
+        # for pasted token lists, so take the sentinel path rather than
+        # raising through the hot loop
+        stale = get_pair_or_none(chain, token, base_addr)
+        if stale is None:
+            return None
+        # try to find a deeper 'active' pool by address; otherwise reuse stale reserves
+        active_addr = active_pool_for_token(chain, token, base_addr) or stale.address
         try:
-            token = _to_checksum(token)
-            # stale (sell) reserves: token -> base
-            stale = get_pair(chain, token, base_addr)
-            # try to find a deeper 'active' pool by address; otherwise reuse stale reserves
-            active_addr = active_pool_for_token(chain, token, base_addr) or stale.address
-            try:
-                a_rin, a_rout = _reserves_from_pair_addr(chain, active_addr, token)
-            except Exception:
-                a_rin, a_rout = stale.r_in, stale.r_out
-
-            # mid prices (token->base)
-            p_stale = stale.r_out / stale.r_in if stale.r_in > 0 else 0.0
-            p_active = a_rout / a_rin if a_rin > 0 else 0.0
-            if p_stale <= 0 or p_active <= 0:
-                continue
-
-            edge_bps = 1e4 * (p_stale / p_active - 1.0)
-
-            if edge_bps < min_edge_bps:
-                continue
-
-            # no-tax pnl over small grid
+            a_rin, a_rout = _reserves_from_pair_addr(chain, active_addr, token)
+        except (Web3Exception, ValueError, requests.RequestException):
+            # Web3Exception also covers BadFunctionCallOutput, i.e. subgraph
+            # addresses that are not actually V2 pairs and decode to garbage
+            a_rin, a_rout = stale.r_in, stale.r_out
+
+        # early out before any division: dead pools cannot produce an edge
+        if stale.r_in <= 0 or a_rin <= 0:
+            return None
+        p_stale = stale.r_out / stale.r_in
+        p_active = a_rout / a_rin
+        if p_stale <= 0 or p_active <= 0:
+            return None
+
+        edge_bps = 1e4 * (p_stale / p_active - 1.0)
+
+        if edge_bps < min_edge_bps:
+            return None
+
+        # upper-bound the achievable pnl at the closed-form optimum; most
+        # tokens fail the gas hurdle even unconstrained, so this skips the
+        # grid math entirely for them
+        x_opt = _optimal_no_tax_size(stale.r_in, stale.r_out, a_rin, a_rout, fee)
+        if x_opt <= 0:
+            return None
+        pnl_ub = (
+            amount_out_v2(x_opt, stale.r_in, stale.r_out, fee, 0.0)
+            - buy_cost_on_active_pool(x_opt, a_rin, a_rout, fee, 0.0)
+            - gas_base_est
+        )
+        if pnl_ub < gas_base_est * 1.2:
+            return None
+
+        # no-tax pnl over small grid picks a representative size among the
+        # requested entries
+        if np is not None:
+            # amount_out_v2 is elementwise closed-form math, so it takes the
+            # whole grid in one call; argmax replaces the Python best-tracking
+            base_out_stale = amount_out_v2(grid, stale.r_in, stale.r_out, fee, 0.0)
+            base_in_active = np.fromiter(
+                (buy_cost_on_active_pool(float(x), a_rin, a_rout, fee, 0.0) for x in grid),
+                dtype=np.float64,
+                count=len(grid),
+            )
+            pnls = base_out_stale - base_in_active - gas_base_est
+            i = int(pnls.argmax())
+            best_no_tax, best_size = float(pnls[i]), float(grid[i])
+        else:
             best_no_tax = float("-inf")
             best_size = 0.0
             for x in grid:
@@ -126,31 +223,57 @@ def discover(
                 if pnl > best_no_tax:
                     best_no_tax, best_size = pnl, x
 
-            # quick hurdle: pnl must beat gas by 20%
-            if best_no_tax < gas_base_est * 1.2:
-                continue
-
-            rows.append(
-                {
-                    "token": token,
-                    "base": base_addr,
-                    "stale_pair": stale.address,
-                    "active_pair": active_addr,
-                    "stale_rin": stale.r_in,
-                    "stale_rout": stale.r_out,
-                    "active_rin": a_rin,
-                    "active_rout": a_rout,
-                    "p_stale": p_stale,
-                    "p_active": p_active,
-                    "edge_bps": edge_bps,
-                    "gas_base_est": gas_base_est,
-                    "best_no_tax": best_no_tax,
-                    "best_size_no_tax": best_size,
-                }
-            )
-        except Exception as e:
-            LOGGER.warning("discover skip %s: %s", token, e)
-            continue
+        # quick hurdle: pnl must beat gas by 20%
+        if best_no_tax < gas_base_est * 1.2:
+            return None
+
+        return {
+            "token": token,
+            "base": base_addr,
+            "stale_pair": stale.address,
+            "active_pair": active_addr,
+            "stale_rin": stale.r_in,
+            "stale_rout": stale.r_out,
+            "active_rin": a_rin,
+            "active_rout": a_rout,
+            "p_stale": p_stale,
+            "p_active": p_active,
+            "edge_bps": edge_bps,
+            "gas_base_est": gas_base_est,
+            "best_no_tax": best_no_tax,
+            "best_size_no_tax": best_size,
+        }
+    except Exception as e:
+        LOGGER.warning("discover skip %s: %s", token, e)
+        return None
+
+
+def discover(
+    chain: str,
+    base: str,
+    tokens: Iterable[str],
+    min_edge_bps: float,
+    fee: float,
+    grid: List[float],
+    top: int,
+) -> List[Dict]:
+    cfg = CHAIN_CONFIGS[chain]
+    base_addr = base if base.lower().startswith("0x") else cfg.wrapped
+    base_addr = _to_checksum(base_addr)
+
+    gas_base_est = _estimate_gas_base(chain)
+    # checksum every token once up front, outside the parallel fan-out
+    tokens = [_to_checksum(t) for t in tokens]
+    # materialize the grid once for every token evaluation
+    grid = np.asarray(list(grid), dtype=np.float64) if np is not None else list(grid)
+
+    # per-token work is dominated by RPC/subgraph round-trips, so fan it out
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, max(len(tokens), 1))) as ex:
+        results = ex.map(
+            lambda t: _process_token(chain, t, base_addr, min_edge_bps, fee, grid, gas_base_est),
+            tokens,
+        )
+        rows = [r for r in results if r]
 
     rows.sort(key=lambda r: r["edge_bps"], reverse=True)
     return rows[:top]
@@ -21,10 +21,9 @@ Usage example:
 from __future__ import annotations
 
 import argparse
-import json
 import math
-import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -32,6 +31,7 @@ import requests
 
 from ..config import CHAIN_CONFIGS
 from ..logging_conf import LOGGER
+from ..utils import save_json
 
 DEFAULT_SUBGRAPHS = {
     # You can override via CLI --subgraph
@@ -52,24 +52,30 @@ query Pairs($skip:Int!,$first:Int!){
 """
 
 # We'll query day data per pair to avoid fetching huge global windows.
-PAIR_DAY_QUERY = """
-query PairDay($pair:String!,$first:Int!){
-  pairDayDatas(first:$first, orderBy: date, orderDirection: desc, where:{pairAddress:$pair}){
-    date
-    dailyVolumeUSD
-    reserveUSD
-  }
-}
-"""
+# Pair queries are batched via GraphQL aliases (p0:, p1:, ...) so one HTTP
+# round-trip covers DAY_DATA_CHUNK pairs instead of one request per pair.
+DAY_DATA_CHUNK = 50
+DAY_DATA_WORKERS = 8
+PAIR_DAY_FIELDS = "{ date dailyVolumeUSD reserveUSD }"
 
 BASE_SYMBOLS = {"WETH", "WBNB", "USDC", "USDT", "DAI"}
 
 
+# Shared session: keep-alive avoids a fresh TCP/TLS handshake per GraphQL
+# request, which dominates latency against TheGraph. Pool sized to match the
+# concurrent day-data chunk fetches.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0),
+)
+
+
 def post(endpoint: str, query: str, variables: dict, tries: int = 3) -> dict:
     last = None
     for i in range(tries):
         try:
-            r = requests.post(endpoint, json={"query": query, "variables": variables}, timeout=30)
+            r = _SESSION.post(endpoint, json={"query": query, "variables": variables}, timeout=30)
             r.raise_for_status()
             data = r.json()
             if "errors" in data:
@@ -81,22 +87,58 @@ def post(endpoint: str, query: str, variables: dict, tries: int = 3) -> dict:
     raise RuntimeError(f"GraphQL error after retries: {last}")
 
 
-def is_base(addr_or_symbol: str, chain: str, base_symbol: str) -> bool:
-    # Accept either exact symbol match or exact address match against chain config
-    v = addr_or_symbol
-    cfg = CHAIN_CONFIGS[chain]
-    if base_symbol.upper() in {"WBNB", "WETH"} and v.lower().startswith("0x"):
-        # compare to wrapped address in config
-        return v.lower() == cfg.wrapped.lower()
-    return v.upper() == base_symbol.upper()
+def fetch_day_data(endpoint: str, pair_ids: List[str], first: int = 14) -> Dict[str, List[dict]]:
+    """Fetch recent pairDayDatas for many pairs with aliased, concurrent queries."""
+
+    def _fetch_chunk(chunk: List[str]) -> Dict[str, List[dict]]:
+        body = "".join(
+            f'p{i}: pairDayDatas(first:{first}, orderBy: date, orderDirection: desc,'
+            f' where:{{pairAddress:"{pid}"}}) {PAIR_DAY_FIELDS}\n'
+            for i, pid in enumerate(chunk)
+        )
+        try:
+            data = post(endpoint, "query Multi {\n" + body + "}", {})
+        except Exception as e:
+            # degrade only this chunk to the no-history default instead of
+            # letting one rate-limited request empty day_data for every pair
+            LOGGER.warning("pairDayDatas chunk failed (%d pairs): %s", len(chunk), e)
+            return {pid: [] for pid in chunk}
+        return {pid: data.get(f"p{i}", []) for i, pid in enumerate(chunk)}
+
+    chunks = [pair_ids[i : i + DAY_DATA_CHUNK] for i in range(0, len(pair_ids), DAY_DATA_CHUNK)]
+    out: Dict[str, List[dict]] = {}
+    with ThreadPoolExecutor(max_workers=DAY_DATA_WORKERS) as ex:
+        for result in ex.map(_fetch_chunk, chunks):
+            out.update(result)
+    return out
+
+
+def base_matcher(chain: str, base_symbol: str):
+    """Precompute set lookups for "is this symbol/address the selected base".
+
+    Built once per run so the pairs loop does two O(1) membership tests per
+    side instead of re-deriving chain config and comparing strings 4x per
+    pair.
+    """
+    base_upper = {base_symbol.upper()}
+    wrapped_lower = (
+        {CHAIN_CONFIGS[chain].wrapped.lower()}
+        if base_symbol.upper() in {"WBNB", "WETH"}
+        else set()
+    )
+
+    def _is_base(v: str) -> bool:
+        return v.upper() in base_upper or v.lower() in wrapped_lower
+
+    return _is_base
 
 
-def pick_token_side(p: dict, chain: str, base_symbol: str) -> Tuple[str, str]:
+def pick_token_side(p: dict, is_base) -> Tuple[str, str]:
     """Return (token_addr, base_addr) if the pair includes the base; else ('','')."""
     t0, t1 = p["token0"], p["token1"]
-    if is_base(t0["symbol"], chain, base_symbol) or is_base(t0["id"], chain, base_symbol):
+    if is_base(t0["symbol"]) or is_base(t0["id"]):
         return (t1["id"], t0["id"])
-    if is_base(t1["symbol"], chain, base_symbol) or is_base(t1["id"], chain, base_symbol):
+    if is_base(t1["symbol"]) or is_base(t1["id"]):
         return (t0["id"], t1["id"])
     return ("", "")
 
@@ -141,11 +183,18 @@ def main() -> None:
     out_dir = Path("out")
     out_dir.mkdir(exist_ok=True)
 
-    # 1) Page through top pairs by reserveUSD
+    # 1) Page through top pairs by reserveUSD — skip offsets are known up
+    #    front, so fetch every page concurrently over the shared session
+    with ThreadPoolExecutor(max_workers=min(args.pages, 8)) as ex:
+        page_results = list(
+            ex.map(
+                lambda pg: post(endpoint, PAIRS_QUERY, {"skip": pg * args.page_size, "first": args.page_size}).get("pairs", []),
+                range(args.pages),
+            )
+        )
+    # preserve the old "stop at first empty page" semantics by trimming
     pairs: List[dict] = []
-    for pg in range(args.pages):
-        data = post(endpoint, PAIRS_QUERY, {"skip": pg * args.page_size, "first": args.page_size})
-        page_pairs = data.get("pairs", [])
+    for page_pairs in page_results:
         if not page_pairs:
             break
         pairs.extend(page_pairs)
@@ -153,23 +202,28 @@ def main() -> None:
     LOGGER.info("Fetched %d pairs from subgraph", len(pairs))
 
     # 2) Filter for pairs that include the selected base
-    candidates = []
+    is_base = base_matcher(chain, args.base)
+    survivors = []
     for p in pairs:
-        token_addr, base_addr = pick_token_side(p, chain, args.base)
+        token_addr, base_addr = pick_token_side(p, is_base)
         if not token_addr:
             continue
         reserve_usd = float(p["reserveUSD"] or 0)
         if reserve_usd < args.min_reserve_usd:
             continue
+        survivors.append((p, token_addr, base_addr, reserve_usd))
 
-        # 3) Pull recent day data (last ~14 days) for staleness
-        try:
-            dd = post(endpoint, PAIR_DAY_QUERY, {"pair": p["id"], "first": 14}).get("pairDayDatas", [])
-        except Exception as e:
-            LOGGER.warning("pairDayDatas failed for %s: %s", p["id"], e)
-            dd = []
+    # 3) Pull recent day data (last ~14 days) for staleness — one aliased
+    #    request per DAY_DATA_CHUNK pairs, chunks fetched concurrently
+    try:
+        day_data = fetch_day_data(endpoint, [p["id"] for p, *_ in survivors])
+    except Exception as e:
+        LOGGER.warning("pairDayDatas batch failed: %s", e)
+        day_data = {}
 
-        vol_24h, vol_7d, age_days = summarize_daydata(dd)
+    candidates = []
+    for p, token_addr, base_addr, reserve_usd in survivors:
+        vol_24h, vol_7d, age_days = summarize_daydata(day_data.get(p["id"], []))
 
         # 4) Apply thresholds (low recent volume, optionally old activity)
         if vol_24h > args.max_24h_usd:
@@ -200,17 +254,11 @@ def main() -> None:
 
     # 5) Write outputs
     json_path = out_dir / f"candidates_{chain}_{args.base}.json"
-    with open(json_path, "w") as f:
-        json.dump(top_rows, f, indent=2)
+    save_json(json_path, top_rows)
     LOGGER.info("wrote %s (%d rows)", json_path, len(top_rows))
 
-    # tokens.txt (dedupe)
-    toks = []
-    seen = set()
-    for r in top_rows:
-        t = r["token"].lower()
-        if t not in seen:
-            toks.append(t); seen.add(t)
+    # tokens.txt (dedupe, order-preserving)
+    toks = list(dict.fromkeys(r["token"].lower() for r in top_rows))
     tokens_path = Path("tokens.txt")
     with open(tokens_path, "w") as f:
         f.write("\n".join(toks) + "\n")
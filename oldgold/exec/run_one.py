@@ -7,42 +7,57 @@ values when data cannot be fetched.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 import os
-
-from web3 import Web3
+import sys
 
 from ..config import CHAIN_CONFIGS
 from ..logging_conf import LOGGER
-from ..scanner.pairs import active_pool_for_token, get_pair
-from ..sim.v2_math import amount_out_v2, buy_cost_on_active_pool
-from ..sim.simulate import parse_grid
-from ..utils import save_json, retry_call
-from ..data.tokens import TOKENS_BY_CHAIN
+from ..scanner.pairs import PairReserves, active_pool_for_token, get_pair_cached, reserves_for_pairs
+from ..sim.v2_math import eval_grid
+from ..sim.simulate import grid_array
+from ..utils import json_dumps, save_json, retry_call
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None
 
 APPROVE_GAS = 50_000
 SWAP_GAS = 200_000
+# one approve plus the buy and sell swaps
+TOTAL_GAS_UNITS = APPROVE_GAS + 2 * SWAP_GAS
+
+_RESULT_FIELDS = ("tokens", "base_out_stale", "base_in_active", "pnl")
+_RESULT_DTYPE = [(name, "f8") for name in _RESULT_FIELDS]
 
 
-def _w3(chain: str) -> Web3:
-    cfg = CHAIN_CONFIGS[chain]
-    return Web3(Web3.HTTPProvider(cfg.rpc))
+def _w3(chain: str):
+    # lazy: keeps web3's multi-hundred-ms import tree off the module path
+    from ..web3_pool import get_w3
+
+    return get_w3(chain)
 
 
 def estimate_gas_base(chain: str) -> float:
-    """Estimate gas cost in native base units."""
+    """Estimate gas cost in native base units (a plain float, not Decimal)."""
 
     try:
         w3 = _w3(chain)
         gas_price = retry_call(3, lambda: w3.eth.gas_price)
     except Exception:  # pragma: no cover - network dependent
         return 0.0
-    total_units = APPROVE_GAS + 2 * SWAP_GAS
-    return float(Web3.from_wei(gas_price * total_units, "ether"))
+    # fixed divide by 10**18 — skips Web3.from_wei's Decimal/unit machinery
+    return (gas_price * TOTAL_GAS_UNITS) / 1e18
 
 
 def resolve_base_addr(chain: str, base: str) -> str:
+    from web3 import Web3
+
+    from ..data.tokens import TOKENS_BY_CHAIN
+
     if base.lower().startswith("0x"):
         return Web3.to_checksum_address(base)
     m = TOKENS_BY_CHAIN.get(chain, {})
@@ -63,24 +78,71 @@ def run_sim(
     sell_tax: float = 0.0,
     gas_base: float = 0.0,
 ) -> dict:
-    sizes = parse_grid(grid)
-    results = []
+    sizes = grid_array(grid)
+    out_stale, in_active, pnls = eval_grid(
+        sizes, stale_rin, stale_rout, active_rin, active_rout,
+        fee, slip_bps, buy_tax, sell_tax, gas_base,
+    )
+    if np is not None and len(sizes):
+        # one contiguous record array while computing; per-row dicts are
+        # materialized only at emit time for the JSON payload
+        rec = np.empty(len(sizes), dtype=_RESULT_DTYPE)
+        rec["tokens"] = sizes
+        rec["base_out_stale"] = out_stale
+        rec["base_in_active"] = in_active
+        rec["pnl"] = pnls
+        i = int(rec["pnl"].argmax())
+        results = [dict(zip(_RESULT_FIELDS, row)) for row in rec.tolist()]
+        return {"results": results, "best": {"size": float(rec["tokens"][i]), "pnl": float(rec["pnl"][i])}}
+    results = [
+        {"tokens": float(x), "base_out_stale": float(bo), "base_in_active": float(bi), "pnl": float(p)}
+        for x, bo, bi, p in zip(sizes, out_stale, in_active, pnls)
+    ]
     best = (0.0, float("-inf"))
-    for x in sizes:
-        base_out_stale = amount_out_v2(x, stale_rin, stale_rout, fee, sell_tax)
-        base_in_active = buy_cost_on_active_pool(x, active_rin, active_rout, fee, buy_tax)
-        pnl = base_out_stale - base_in_active - gas_base - abs(base_out_stale) * slip_bps / 1e4
-        results.append(
+    for r in results:
+        if r["pnl"] > best[1]:
+            best = (r["tokens"], r["pnl"])
+    return {"results": results, "best": {"size": best[0], "pnl": best[1]}}
+
+
+_DENY_PATH = Path(__file__).resolve().parent.parent / "data" / "denylists.json"
+_DENY_CACHE: tuple[float, dict] | None = None
+
+
+def _denylists() -> dict:
+    """Return lowercase denylist sets, re-read only when the file changes."""
+
+    global _DENY_CACHE
+    try:
+        mtime = os.stat(_DENY_PATH).st_mtime
+    except FileNotFoundError:  # pragma: no cover - optional file
+        return {"tokens": frozenset(), "pairs": frozenset()}
+    if _DENY_CACHE is None or _DENY_CACHE[0] != mtime:
+        deny = json.loads(_DENY_PATH.read_text())
+        _DENY_CACHE = (
+            mtime,
             {
-                "tokens": x,
-                "base_out_stale": base_out_stale,
-                "base_in_active": base_in_active,
-                "pnl": pnl,
-            }
+                "tokens": frozenset(t.lower() for t in deny.get("tokens", [])),
+                "pairs": frozenset(p.lower() for p in deny.get("pairs", [])),
+            },
         )
-        if pnl > best[1]:
-            best = (x, pnl)
-    return {"results": results, "best": {"size": best[0], "pnl": best[1]}}
+    return _DENY_CACHE[1]
+
+
+def _probe_taxes(chain: str, token: str, dry_run: bool, force_probe: bool) -> tuple[float, float]:
+    """Run the tax probe, degrading to 0% taxes on any failure."""
+
+    from ..tax.probe import main as probe_main
+
+    tax = {}
+    try:
+        tax = probe_main(chain=chain, token=token, dry_run=dry_run, force_probe=force_probe) or {}
+    except Exception as e:  # pragma: no cover - network dependent
+        LOGGER.warning("probe failed: %s (continuing with 0%% taxes)", e)
+    return (
+        float(tax.get("buy_tax_est", 0.0) or 0.0),
+        float(tax.get("sell_tax_est", 0.0) or 0.0),
+    )
 
 
 def main(
@@ -94,43 +156,40 @@ def main(
     grid: str = "1e3,5e3,1e4",
     dry_run: bool = False,
     force_probe: bool = False,
-) -> None:
+) -> dict | None:
     if not token:
         raise SystemExit("token is required")
 
     base_addr = resolve_base_addr(chain, base)
 
-    deny_path = Path(__file__).resolve().parent.parent / "data" / "denylists.json"
-    try:
-        deny = json.loads(deny_path.read_text())
-    except FileNotFoundError:  # pragma: no cover - optional file
-        deny = {"tokens": [], "pairs": []}
-    if token.lower() in {t.lower() for t in deny.get("tokens", [])}:
+    if token.lower() in _denylists()["tokens"]:
         LOGGER.warning("token %s is denylisted", token)
-        return
-
-    stale = get_pair(chain, token, base_addr)
-    if stale_pair:
-        stale.address = stale_pair
-
-    if active_pair == "auto" or not active_pair:
-        active_addr = active_pool_for_token(chain, token, base_addr) or stale.address
-    else:
-        active_addr = active_pair
-    active = get_pair(chain, token, base_addr)
-    active.address = active_addr
-
-    from ..tax.probe import main as probe_main
-
-    tax = {}
-    try:
-        tax = probe_main(chain=chain, token=token, dry_run=dry_run, force_probe=force_probe) or {}
-    except Exception as e:  # pragma: no cover - network dependent
-        LOGGER.warning("probe failed: %s (continuing with 0%% taxes)", e)
-    buy_tax = float(tax.get("buy_tax_est", 0.0) or 0.0)
-    sell_tax = float(tax.get("sell_tax_est", 0.0) or 0.0)
-
-    gas_base = estimate_gas_base(chain)
+        return None
+
+    # the pair lookup, active-pool heuristic, tax probe and gas estimate are
+    # independent network hops; run them concurrently and join on the results
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        f_stale = ex.submit(get_pair_cached, chain, token, base_addr)
+        f_active = (
+            ex.submit(active_pool_for_token, chain, token, base_addr)
+            if active_pair == "auto" or not active_pair
+            else None
+        )
+        f_tax = ex.submit(_probe_taxes, chain, token, dry_run, force_probe)
+        f_gas = ex.submit(estimate_gas_base, chain)
+
+        stale = f_stale.result()
+        if stale_pair:
+            stale.address = stale_pair
+        active_addr = (f_active.result() or stale.address) if f_active else active_pair
+        buy_tax, sell_tax = f_tax.result()
+        gas_base = f_gas.result()
+
+    active = PairReserves(active_addr, stale.r_in, stale.r_out)
+    if active_addr.lower() != stale.address.lower():
+        fetched = reserves_for_pairs(chain, token, base_addr, [active_addr])[0]
+        if fetched is not None:
+            active = fetched
 
     sim = run_sim(
         stale_rin=stale.r_in,
@@ -188,7 +247,36 @@ def main(
         "pnl": sim["best"]["pnl"],
         "decision": decision,
     }
-    print(json.dumps({"oldgold_summary": summary}, separators=(",", ":")))
+    sys.stdout.buffer.write(json_dumps({"oldgold_summary": summary}) + b"\n")
+    sys.stdout.buffer.flush()
+    return summary
+
+
+def run_many(tokens: list[str], **kwargs) -> list[dict]:
+    """Run :func:`main` for many tokens on the shared process pool.
+
+    Workers keep their interpreter (and the web3/numpy import cost) alive
+    across tokens, so the per-token overhead is just pickling the summary.
+    Failed or denylisted tokens are logged and dropped from the result.
+    """
+
+    from concurrent.futures import as_completed
+
+    from ._pool import get_pool
+
+    futures = {get_pool().submit(main, token=t, **kwargs): t for t in tokens}
+    outs: list[dict] = []
+    for fut in as_completed(futures):
+        token = futures[fut]
+        try:
+            summary = fut.result()
+        except Exception as e:  # pragma: no cover - network dependent
+            LOGGER.warning("run-one failed for %s: %s", token, e)
+            summary = None
+        LOGGER.info("==> %s %s", token, "ok" if summary else "failed")
+        if summary:
+            outs.append(summary)
+    return outs
 
 
 if __name__ == "__main__":  # pragma: no cover - manual use
@@ -1,16 +1,29 @@
-"""Logging configuration with optional Rich support."""
+"""Logging configuration with optional Rich support.
+
+Rich (and the Pygments tree it drags in) is only imported when stderr is
+an interactive terminal and OLDGOLD_RICH is not disabled, keeping the
+import off the cold-start path for piped/batch invocations.
+"""
 import logging
+import os
+import sys
 
-try:  # pragma: no cover - optional dependency
-    from rich.logging import RichHandler
+if sys.stderr.isatty() and os.getenv("OLDGOLD_RICH", "1") == "1":
+    try:  # pragma: no cover - optional dependency
+        from rich.logging import RichHandler
 
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(message)s",
+            handlers=[RichHandler(rich_tracebacks=True)],
+        )
+    except Exception:  # pragma: no cover
+        logging.basicConfig(level=logging.INFO)
+else:
     logging.basicConfig(
         level=logging.INFO,
-        format="%(message)s",
-        handlers=[RichHandler(rich_tracebacks=True)],
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
     )
-except Exception:  # pragma: no cover
-    logging.basicConfig(level=logging.INFO)
 
 
 LOGGER = logging.getLogger("oldgold")
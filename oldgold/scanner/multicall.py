@@ -0,0 +1,43 @@
+"""Thin wrapper around the Multicall3 aggregator contract.
+
+Multicall3 is deployed at the same address on every major chain and lets
+callers fold many ``eth_call``s into a single on-chain ``aggregate3``
+invocation, so all results come back in one HTTP round-trip and are read
+atomically from the same block.
+"""
+from __future__ import annotations
+
+import json
+from typing import List, Tuple
+
+from web3 import Web3
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = json.loads(
+    """[
+    {"name": "aggregate3", "inputs": [{"name": "calls", "type": "tuple[]", "components": [{"name": "target", "type": "address"}, {"name": "allowFailure", "type": "bool"}, {"name": "callData", "type": "bytes"}]}], "outputs": [{"name": "returnData", "type": "tuple[]", "components": [{"name": "success", "type": "bool"}, {"name": "returnData", "type": "bytes"}]}], "stateMutability": "payable", "type": "function"}
+    ]"""
+)
+
+
+def aggregate3(
+    w3: Web3,
+    calls: List[Tuple[str, bytes]],
+    allow_failure: bool = True,
+) -> List[Tuple[bool, bytes]]:
+    """Execute ``(target, calldata)`` pairs in one ``eth_call``.
+
+    Returns ``(success, return_data)`` per call, in order.  Raises if
+    Multicall3 itself is unreachable (e.g. not deployed on the chain);
+    callers should fall back to individual calls in that case.
+    """
+
+    mc = w3.eth.contract(
+        address=Web3.to_checksum_address(MULTICALL3_ADDRESS), abi=MULTICALL3_ABI
+    )
+    entries = [
+        (Web3.to_checksum_address(target), allow_failure, calldata)
+        for target, calldata in calls
+    ]
+    return [(bool(ok), bytes(raw)) for ok, raw in mc.functions.aggregate3(entries).call()]
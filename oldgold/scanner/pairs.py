@@ -11,15 +11,24 @@ an active pool with the deepest liquidity.
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 import json
+import os
+from operator import itemgetter
+from typing import List, Tuple
 
-from web3 import Web3
+import requests
 
 from ..config import CHAIN_CONFIGS, SUBGRAPHS
 from ..logging_conf import LOGGER
 from ..utils import retry_call
+from . import reserve_cache
 from .subgraph_client import post
 
+# web3 (and the eth-abi/eth-utils tree underneath) costs hundreds of ms to
+# import; it is pulled in lazily inside the functions that hit the chain so
+# importing this module for PairReserves or the subgraph helpers stays cheap.
+
 # Minimal ABI fragments for factory/pair contracts.  Only the methods we
 # use are included which keeps the dependency light.
 FACTORY_ABI = json.loads(
@@ -45,9 +54,50 @@ class PairReserves:
     r_out: float
 
 
-def _w3(chain: str) -> Web3:
+def _w3(chain: str):
+    from ..web3_pool import get_w3
+
+    return get_w3(chain)
+
+
+@functools.lru_cache(maxsize=None)
+def _factory_contract(chain: str):
     cfg = CHAIN_CONFIGS[chain]
-    return Web3(Web3.HTTPProvider(cfg.rpc))
+    return _w3(chain).eth.contract(address=cfg.factory, abi=FACTORY_ABI)
+
+
+@functools.lru_cache(maxsize=4096)
+def _pair_contract(chain: str, pair_addr: str):
+    return _w3(chain).eth.contract(address=pair_addr, abi=PAIR_ABI)
+
+
+def rpc_batch_call(chain: str, calls: List[Tuple[str, str]]) -> List[bytes]:
+    """Send several ``eth_call``s as one JSON-RPC batch array.
+
+    ``calls`` is a list of ``(to, calldata_hex)``; results come back as raw
+    bytes in the same order.  Raises on transport errors, per-call errors or
+    providers that reject batch arrays — callers fall back to serial calls.
+    """
+    payload = [
+        {
+            "jsonrpc": "2.0",
+            "id": i,
+            "method": "eth_call",
+            "params": [{"to": to, "data": data}, "latest"],
+        }
+        for i, (to, data) in enumerate(calls)
+    ]
+    resp = requests.post(CHAIN_CONFIGS[chain].rpc, json=payload, timeout=30)
+    resp.raise_for_status()
+    data = resp.json()
+    if not isinstance(data, list):
+        raise RuntimeError(f"provider rejected batch eth_call: {data}")
+    out: List[bytes] = [b""] * len(calls)
+    for item in data:
+        if "error" in item:
+            raise RuntimeError(item["error"])
+        out[int(item["id"])] = bytes.fromhex(item["result"][2:])
+    return out
 
 
 def get_pair(chain: str, token_in: str, token_out: str) -> PairReserves:
@@ -63,23 +113,98 @@ def get_pair(chain: str, token_in: str, token_out: str) -> PairReserves:
         Address of the output token.
     """
 
-    w3 = _w3(chain)
-    cfg = CHAIN_CONFIGS[chain]
-    factory = w3.eth.contract(address=cfg.factory, abi=FACTORY_ABI)
-    pair_addr: str = factory.functions.getPair(token_in, token_out).call()
-    if int(pair_addr, 16) == 0:
+    res = get_pair_or_none(chain, token_in, token_out)
+    if res is None:
         raise ValueError("pair does not exist")
-    pair_c = w3.eth.contract(address=pair_addr, abi=PAIR_ABI)
-    token0 = pair_c.functions.token0().call()
-    token1 = pair_c.functions.token1().call()
+    return res
+
+
+def get_pair_or_none(chain: str, token_in: str, token_out: str) -> PairReserves | None:
+    """Variant of :func:`get_pair` returning ``None`` for missing pairs.
+
+    Scanners iterate many tokens where "no pair" is the common case; a
+    sentinel return keeps that path off the exception machinery.
+    """
+
+    pair_addr: str = _factory_contract(chain).functions.getPair(token_in, token_out).call()
+    if int(pair_addr, 16) == 0:
+        return None
+    pair_c = _pair_contract(chain, pair_addr)
     r0, r1, _ = retry_call(3, lambda: pair_c.functions.getReserves().call())
-    if token_in.lower() == token0.lower():
+    # V2 pairs store tokens sorted by address, so token0 is knowable offline
+    token0_is_in = int(token_in, 16) < int(token_out, 16)
+    if os.getenv("OG_VERIFY_TOKEN_ORDER") == "1":  # pragma: no cover - debug aid
+        token0 = pair_c.functions.token0().call()
+        assert (token_in.lower() == token0.lower()) == token0_is_in, (
+            f"token ordering mismatch for pair {pair_addr}"
+        )
+    if token0_is_in:
         r_in, r_out = r0, r1
     else:
         r_in, r_out = r1, r0
     return PairReserves(pair_addr, float(r_in), float(r_out))
 
 
+def get_pair_cached(chain: str, token_in: str, token_out: str, block: int | None = None) -> PairReserves:
+    """:func:`get_pair` fronted by the on-disk reserve cache.
+
+    Reserves are immutable per block, so a warm hit for the current block
+    costs zero RPCs.  ``block`` defaults to the chain head when omitted.
+    """
+
+    if block is None:
+        block = _w3(chain).eth.block_number
+    hit = reserve_cache.get_reserves(chain, token_in, token_out, block)
+    if hit is not None:
+        return PairReserves(hit[0], hit[1], hit[2])
+    res = get_pair(chain, token_in, token_out)
+    reserve_cache.put_reserves(chain, token_in, token_out, block, res.address, res.r_in, res.r_out)
+    return res
+
+
+# getReserves() selector; the pair addresses vary but the calldata never does.
+GET_RESERVES_CALLDATA = bytes.fromhex("0902f1ac")
+
+
+def reserves_for_pairs(
+    chain: str, token_in: str, token_out: str, addresses: List[str]
+) -> List[PairReserves | None]:
+    """Fetch reserves for several ``token_in``/``token_out`` pools in one RPC.
+
+    All pools must hold the same token pair so directional reserves can be
+    derived offline.  Uses Multicall3 so every pool is read from the same
+    block; falls back to per-pool ``eth_call``s when the aggregator is
+    unavailable.  Entries whose read fails come back as ``None``.
+    """
+
+    from web3 import Web3
+
+    from .multicall import aggregate3
+
+    w3 = _w3(chain)
+    token0_is_in = int(token_in, 16) < int(token_out, 16)
+    try:
+        results = aggregate3(w3, [(a, GET_RESERVES_CALLDATA) for a in addresses])
+    except Exception as exc:  # pragma: no cover - chain dependent
+        LOGGER.debug("multicall reserves failed (%s); falling back to serial calls", exc)
+        results = []
+        for a in addresses:
+            try:
+                raw = w3.eth.call({"to": Web3.to_checksum_address(a), "data": GET_RESERVES_CALLDATA})
+                results.append((True, bytes(raw)))
+            except Exception:
+                results.append((False, b""))
+    out: List[PairReserves | None] = []
+    for addr, (ok, raw) in zip(addresses, results):
+        if not ok or len(raw) < 96:
+            out.append(None)
+            continue
+        r0, r1, _ = w3.codec.decode(["uint112", "uint112", "uint32"], raw)
+        r_in, r_out = (r0, r1) if token0_is_in else (r1, r0)
+        out.append(PairReserves(addr, float(r_in), float(r_out)))
+    return out
+
+
 def active_pool_for_token(chain: str, token: str, base: str) -> str:
     """Return the address of the deepest pool for ``token``/``base``.
 
@@ -92,6 +217,29 @@ def active_pool_for_token(chain: str, token: str, base: str) -> str:
     if not endpoint:
         LOGGER.warning("no subgraph endpoint configured for %s", chain)
         return ""
+    cached = reserve_cache.get_active_pool(chain, token, base)
+    if cached is not None:
+        return cached
+    variables = {"token": token.lower(), "base": base.lower()}
+    # let the subgraph pick the winner: ordered + first:1 returns one row
+    # and skips any client-side comparison
+    query = """
+    query ($token: String!, $base: String!) {
+      pairs(where: {
+        token0_in: [$token, $base],
+        token1_in: [$token, $base]
+      }, orderBy: reserveUSD, orderDirection: desc, first: 1) {
+        id
+      }
+    }
+    """
+    try:
+        pairs = post(endpoint, query, variables).get("pairs", [])
+        best_id = pairs[0]["id"] if pairs else ""
+        reserve_cache.put_active_pool(chain, token, base, best_id)
+        return best_id
+    except Exception as exc:
+        LOGGER.debug("ordered pool query failed (%s); selecting client-side", exc)
     query = """
     query ($token: String!, $base: String!) {
       pairs(where: {
@@ -100,19 +248,22 @@ def active_pool_for_token(chain: str, token: str, base: str) -> str:
       }) {
         id
         reserveUSD
-        token0 { id }
-        token1 { id }
       }
     }
     """
     try:
-        data = post(endpoint, query, {"token": token.lower(), "base": base.lower()})
+        pairs = post(endpoint, query, variables).get("pairs", [])
     except Exception as exc:  # pragma: no cover - network issues
         LOGGER.error("subgraph query failed: %s", exc)
         return ""
-    pairs = data.get("pairs", [])
-    best = max(pairs, key=lambda p: float(p.get("reserveUSD", 0)), default=None)
-    return best["id"] if best else ""
+    get_reserve = itemgetter("reserveUSD")
+    best_id, best_val = "", -1.0
+    for p in pairs:
+        v = float(get_reserve(p))
+        if v > best_val:
+            best_id, best_val = p["id"], v
+    reserve_cache.put_active_pool(chain, token, base, best_id)
+    return best_id
 
 
 def main(chain: str = "bsc", token: str = "", base: str = "WBNB") -> None:
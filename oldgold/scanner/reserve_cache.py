@@ -0,0 +1,95 @@
+"""On-disk cache for pair reserves and active-pool lookups.
+
+Reserves only change when a swap lands, so keyed by ``(chain, token_in,
+token_out, block)`` they are immutable — warm re-runs within the same
+block (backtesting loops, repeated ``run-one`` calls) can skip the RPC
+entirely.  A short TTL bounds staleness for callers that reuse a block
+number across the block boundary.  Set ``OG_NO_CACHE=1`` to bypass.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+DB_PATH = Path("out") / "reserves.sqlite"
+TTL = float(os.getenv("OG_RESERVE_TTL", "12"))  # ~one BSC block
+
+_LOCAL = threading.local()
+
+
+def _enabled() -> bool:
+    return os.getenv("OG_NO_CACHE") != "1"
+
+
+def _conn() -> sqlite3.Connection:
+    conn = getattr(_LOCAL, "conn", None)
+    if conn is None:
+        DB_PATH.parent.mkdir(exist_ok=True)
+        conn = sqlite3.connect(DB_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS reserves ("
+            " chain TEXT, token_in TEXT, token_out TEXT, block INTEGER,"
+            " address TEXT, r_in REAL, r_out REAL, ts REAL,"
+            " PRIMARY KEY (chain, token_in, token_out, block))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS active_pool ("
+            " chain TEXT, token TEXT, base TEXT, minute INTEGER, address TEXT,"
+            " PRIMARY KEY (chain, token, base, minute))"
+        )
+        _LOCAL.conn = conn
+    return conn
+
+
+def get_reserves(chain: str, token_in: str, token_out: str, block: int):
+    """Return ``(address, r_in, r_out)`` or ``None`` on miss/expiry."""
+
+    if not _enabled():
+        return None
+    row = _conn().execute(
+        "SELECT address, r_in, r_out, ts FROM reserves"
+        " WHERE chain=? AND token_in=? AND token_out=? AND block=?",
+        (chain, token_in.lower(), token_out.lower(), block),
+    ).fetchone()
+    if row is None or time.time() - row[3] > TTL:
+        return None
+    return row[0], row[1], row[2]
+
+
+def put_reserves(
+    chain: str, token_in: str, token_out: str, block: int, address: str, r_in: float, r_out: float
+) -> None:
+    if not _enabled():
+        return
+    conn = _conn()
+    conn.execute(
+        "INSERT OR REPLACE INTO reserves VALUES (?,?,?,?,?,?,?,?)",
+        (chain, token_in.lower(), token_out.lower(), block, address, r_in, r_out, time.time()),
+    )
+    conn.commit()
+
+
+def get_active_pool(chain: str, token: str, base: str) -> str | None:
+    """Return the cached pool address for the current minute, or ``None``."""
+
+    if not _enabled():
+        return None
+    row = _conn().execute(
+        "SELECT address FROM active_pool WHERE chain=? AND token=? AND base=? AND minute=?",
+        (chain, token.lower(), base.lower(), int(time.time() // 60)),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def put_active_pool(chain: str, token: str, base: str, address: str) -> None:
+    if not _enabled():
+        return
+    conn = _conn()
+    conn.execute(
+        "INSERT OR REPLACE INTO active_pool VALUES (?,?,?,?,?)",
+        (chain, token.lower(), base.lower(), int(time.time() // 60), address),
+    )
+    conn.commit()
@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import argparse
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List
 
@@ -15,10 +18,17 @@ BASE_SYMBOLS = {"WETH", "USDC", "USDT", "DAI", "WBNB"}
 
 def fetch_pairs(endpoint: str) -> List[Dict]:
     query = Path(__file__).with_name("v2_pairs_query.graphql").read_text()
-    pairs: List[Dict] = []
-    for page in range(OG_MAX_PAGES):
+
+    def _page(page: int) -> List[Dict]:
         data = post(endpoint, query, {"skip": page * OG_LIMIT, "first": OG_LIMIT})
-        part = data.get("pairs", [])
+        return data.get("pairs", [])
+
+    # skip offsets are known up front, so pages fetch concurrently; anything
+    # past the first empty page is dropped to keep the sequential semantics
+    with ThreadPoolExecutor(max_workers=max(1, min(8, OG_MAX_PAGES))) as ex:
+        parts = list(ex.map(_page, range(OG_MAX_PAGES)))
+    pairs: List[Dict] = []
+    for part in parts:
         if not part:
             break
         pairs.extend(part)
@@ -31,7 +41,7 @@ def score_pair(p: Dict) -> float:
     return reserve / (volume + 100.0)
 
 
-def filter_pairs(pairs: List[Dict]) -> List[Dict]:
+def filter_pairs(pairs: List[Dict], top: int = 100) -> List[Dict]:
     out: List[Dict] = []
     for p in pairs:
         if float(p.get("reserveUSD", 0)) < OG_MIN_LIQ_USD:
@@ -39,11 +49,11 @@ def filter_pairs(pairs: List[Dict]) -> List[Dict]:
         t0 = p["token0"]["symbol"]
         t1 = p["token1"]["symbol"]
         if t0 in BASE_SYMBOLS or t1 in BASE_SYMBOLS:
-            p = dict(p)
+            # annotate in place rather than copying every surviving dict
             p["score"] = score_pair(p)
             out.append(p)
-    out.sort(key=lambda x: x["score"], reverse=True)
-    return out
+    # only the top slice is ever kept, so avoid sorting the full list
+    return heapq.nlargest(top, out, key=itemgetter("score"))
 
 
 def main(network: str = "eth_univ2") -> None:
@@ -56,7 +66,7 @@ def main(network: str = "eth_univ2") -> None:
     except Exception as exc:  # pragma: no cover - network issues
         LOGGER.error("scan failed: %s", exc)
         pairs = []
-    pairs = filter_pairs(pairs)[:100]
+    pairs = filter_pairs(pairs)
 
     out_path = Path("out")
     out_path.mkdir(exist_ok=True)
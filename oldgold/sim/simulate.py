@@ -2,17 +2,39 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import time
 from pathlib import Path
-from typing import List
+from typing import Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None
 
 from ..utils import save_json
-from .v2_math import amount_out_v2, buy_cost_on_active_pool
+from .v2_math import eval_grid
+
+
+@functools.lru_cache(maxsize=32)
+def parse_grid(grid: str) -> Tuple[float, ...]:
+    return tuple(float(x) for x in grid.split(",") if x)
 
 
-def parse_grid(grid: str) -> List[float]:
-    return [float(x) for x in grid.split(",") if x]
+@functools.lru_cache(maxsize=32)
+def grid_array(grid: str):
+    """Cached float64 array for ``grid`` (the plain tuple without NumPy).
+
+    Batched runs evaluate the same grid string for every token; caching the
+    buffer keeps the parse and allocation out of the per-token path.  The
+    array is marked read-only since it is shared across callers.
+    """
+    if np is None:
+        return parse_grid(grid)
+    arr = np.asarray(parse_grid(grid), dtype=np.float64)
+    arr.setflags(write=False)
+    return arr
 
 
 def main(
@@ -27,23 +49,19 @@ def main(
     slip_bps: float,
     grid: str,
 ) -> None:
-    sizes = parse_grid(grid)
-    results = []
+    sizes = grid_array(grid)
+    out_stale, in_active, pnls = eval_grid(
+        sizes, stale_rin, stale_rout, active_rin, active_rout,
+        fee, slip_bps, buy_tax, sell_tax, gas_base,
+    )
+    results = [
+        {"tokens": float(x), "base_out_stale": float(bo), "base_in_active": float(bi), "pnl": float(p)}
+        for x, bo, bi, p in zip(sizes, out_stale, in_active, pnls)
+    ]
     best = (0.0, float("-inf"))
-    for x in sizes:
-        base_out_stale = amount_out_v2(x, stale_rin, stale_rout, fee, sell_tax)
-        base_in_active = buy_cost_on_active_pool(x, active_rin, active_rout, fee, buy_tax)
-        pnl = base_out_stale - base_in_active - gas_base - abs(base_out_stale) * slip_bps / 1e4
-        results.append(
-            {
-                "tokens": x,
-                "base_out_stale": base_out_stale,
-                "base_in_active": base_in_active,
-                "pnl": pnl,
-            }
-        )
-        if pnl > best[1]:
-            best = (x, pnl)
+    for r in results:
+        if r["pnl"] > best[1]:
+            best = (r["tokens"], r["pnl"])
 
     out_dir = Path("out")
     out_dir.mkdir(exist_ok=True)
@@ -1,15 +1,30 @@
-"""V2 constant product math with taxes."""
+"""V2 constant product math with taxes.
+
+The kernels are pure float arithmetic, so when Numba is installed they are
+JIT-compiled (``cache=True`` amortizes compilation across runs); otherwise
+the plain Python definitions are used unchanged.
+"""
 from __future__ import annotations
 
+try:  # pragma: no cover - optional dependency
+    from numba import njit
+except Exception:  # pragma: no cover
+    njit = None
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None
+
 
-def amount_out_v2(amount_in_nominal: float, R_in: float, R_out: float, fee: float, sell_tax: float) -> float:
+def _amount_out_v2(amount_in_nominal: float, R_in: float, R_out: float, fee: float, sell_tax: float) -> float:
     """Amount out for a V2 swap with input-side tax."""
     eff_in = amount_in_nominal * (1 - sell_tax)
     amount_in_with_fee = eff_in * (1 - fee)
     return (amount_in_with_fee * R_out) / (R_in + amount_in_with_fee)
 
 
-def buy_cost_on_active_pool(
+def _buy_cost_on_active_pool(
     tokens_out_target: float,
     token_reserve: float,
     base_reserve: float,
@@ -17,19 +32,136 @@ def buy_cost_on_active_pool(
     buy_tax: float,
     tol: float = 1e-9,
 ) -> float:
-    """Return base needed on active pool to receive target tokens after tax."""
+    """Return base needed on active pool to receive target tokens after tax.
+
+    Closed-form inverse of the V2 swap curve: with the pre-tax target
+    ``t = tokens_out_target / (1 - buy_tax)``,
+
+        base_in = base_reserve * t / ((token_reserve - t) * (1 - fee))
 
-    def tokens_out(base_in: float) -> float:
-        out = amount_out_v2(base_in, base_reserve, token_reserve, fee, 0.0)
-        return out * (1 - buy_tax)
+    Targets at or beyond the pool's token reserve are unreachable at any
+    price; those return the same saturation cost the old 128-step bisection
+    converged to, so infeasible sizes stay hugely unprofitable instead of
+    raising mid-scan.  ``tol`` is kept for signature compatibility.
+    """
+    target = tokens_out_target / (1 - buy_tax)
+    if target >= token_reserve:
+        return base_reserve * 1e6
+    return base_reserve * target / ((token_reserve - target) * (1 - fee))
 
-    lo, hi = 0.0, base_reserve * 1e6
-    for _ in range(128):
-        mid = (lo + hi) / 2
-        if tokens_out(mid) < tokens_out_target:
-            lo = mid
+
+def _eval_grid_kernel(
+    sizes,
+    stale_rin: float,
+    stale_rout: float,
+    active_rin: float,
+    active_rout: float,
+    fee: float,
+    slip_bps: float,
+    buy_tax: float,
+    sell_tax: float,
+    gas_base: float,
+):
+    # scalar-only inner loop with hoisted constants: compiles cleanly under
+    # Numba and autovectorizes; mirrors _amount_out_v2 and the closed-form
+    # _buy_cost_on_active_pool
+    one_minus_fee = 1.0 - fee
+    sell_keep = 1.0 - sell_tax
+    buy_keep = 1.0 - buy_tax
+    slip = slip_bps / 1e4
+    n = sizes.shape[0]
+    out_stale = np.empty(n, dtype=np.float64)
+    in_active = np.empty(n, dtype=np.float64)
+    pnl = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        x = sizes[i]
+        eff_in = x * sell_keep * one_minus_fee
+        bo = (eff_in * stale_rout) / (stale_rin + eff_in)
+        t = x / buy_keep
+        if t >= active_rin:
+            bi = active_rout * 1e6
         else:
-            hi = mid
-        if hi - lo < tol:
-            break
-    return hi
+            bi = active_rout * t / ((active_rin - t) * one_minus_fee)
+        out_stale[i] = bo
+        in_active[i] = bi
+        pnl[i] = bo - bi - gas_base - abs(bo) * slip
+    return out_stale, in_active, pnl
+
+
+def _eval_grid_numpy(
+    sizes,
+    stale_rin: float,
+    stale_rout: float,
+    active_rin: float,
+    active_rout: float,
+    fee: float,
+    slip_bps: float,
+    buy_tax: float,
+    sell_tax: float,
+    gas_base: float,
+):
+    # whole-array formulation for the no-Numba case: every formula is
+    # elementwise, so N interpreter iterations become a handful of C loops
+    x = np.asarray(sizes, dtype=np.float64)
+    eff_in = x * ((1.0 - sell_tax) * (1.0 - fee))
+    out_stale = eff_in * stale_rout / (stale_rin + eff_in)
+    t = x / (1.0 - buy_tax)
+    feasible = t < active_rin
+    denom = np.where(feasible, (active_rin - t) * (1.0 - fee), 1.0)
+    in_active = np.where(feasible, active_rout * t / denom, active_rout * 1e6)
+    pnl = out_stale - in_active - gas_base - np.abs(out_stale) * (slip_bps / 1e4)
+    return out_stale, in_active, pnl
+
+
+def eval_grid(
+    sizes,
+    stale_rin: float,
+    stale_rout: float,
+    active_rin: float,
+    active_rout: float,
+    fee: float,
+    slip_bps: float,
+    buy_tax: float = 0.0,
+    sell_tax: float = 0.0,
+    gas_base: float = 0.0,
+):
+    """Evaluate (base_out_stale, base_in_active, pnl) for every grid size.
+
+    One call replaces the per-size Python loop in the simulators; returns
+    three parallel sequences aligned with ``sizes``.
+    """
+    if np is not None:
+        args = (
+            float(stale_rin),
+            float(stale_rout),
+            float(active_rin),
+            float(active_rout),
+            float(fee),
+            float(slip_bps),
+            float(buy_tax),
+            float(sell_tax),
+            float(gas_base),
+        )
+        if njit is not None:
+            return _eval_grid_kernel(np.asarray(sizes, dtype=np.float64), *args)
+        return _eval_grid_numpy(sizes, *args)
+    out_stale = []
+    in_active = []
+    pnl = []
+    for x in sizes:
+        bo = amount_out_v2(x, stale_rin, stale_rout, fee, sell_tax)
+        bi = buy_cost_on_active_pool(x, active_rin, active_rout, fee, buy_tax)
+        out_stale.append(bo)
+        in_active.append(bi)
+        pnl.append(bo - bi - gas_base - abs(bo) * slip_bps / 1e4)
+    return out_stale, in_active, pnl
+
+
+if njit is not None:
+    amount_out_v2 = njit(cache=True, fastmath=True)(_amount_out_v2)
+    buy_cost_on_active_pool = njit(cache=True, fastmath=True)(_buy_cost_on_active_pool)
+    if np is not None:
+        _eval_grid_kernel = njit(cache=True, fastmath=True)(_eval_grid_kernel)
+else:
+    amount_out_v2 = _amount_out_v2
+    buy_cost_on_active_pool = _buy_cost_on_active_pool
@@ -135,3 +135,15 @@ PAIR = [
         "outputs": [{"name": "", "type": "address"}],
     },
 ]
+
+# Pre-encoded calldata for the ERC20 views the probes hammer: the bytes never
+# change, so hot paths can skip the ABI lookup + encode a contract proxy pays
+# on every call.  Hex strings work for both raw eth_call and Multicall3 args.
+SYMBOL_CALLDATA = "0x95d89b41"  # symbol()
+DECIMALS_CALLDATA = "0x313ce567"  # decimals()
+_BALANCEOF_SELECTOR = "0x70a08231"  # balanceOf(address)
+
+
+def balance_of_calldata(owner: str) -> str:
+    """Calldata for ``balanceOf(owner)`` without touching the ABI encoder."""
+    return _BALANCEOF_SELECTOR + owner[2:].lower().zfill(64)
@@ -1,20 +1,64 @@
-import json, time, os
+import json, time, os, threading
+try:  # optional fast path
+    import orjson
+except Exception:
+    orjson = None
 PATH = "out/tax_cache.json"
 
+# serializes read-modify-write cycles when probes run on a thread pool
+_LOCK = threading.RLock()
+
+# parsed-file memo: repeated get/put in one process reuse the dict and only
+# reload when the file on disk actually changed (mtime moved)
+_CACHE = None
+_MTIME = 0.0
+
 def load():
+    global _CACHE, _MTIME
     try:
-        return json.load(open(PATH))
-    except Exception:
-        return {}
+        mtime = os.stat(PATH).st_mtime
+    except OSError:
+        _CACHE, _MTIME = {}, 0.0
+        return _CACHE
+    if _CACHE is None or mtime != _MTIME:
+        try:
+            with open(PATH, "rb") as f:
+                raw = f.read()
+            _CACHE = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except Exception:
+            _CACHE = {}
+        _MTIME = mtime
+    return _CACHE
 
-def save(d):
-    os.makedirs("out", exist_ok=True)
-    json.dump(d, open(PATH, "w"), indent=2)
+def save(d, pretty=False):
+    global _CACHE, _MTIME
+    with _LOCK:
+        os.makedirs("out", exist_ok=True)
+        tmp = PATH + ".tmp"
+        if orjson is not None:
+            raw = orjson.dumps(d, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(d)
+        else:
+            raw = json.dumps(d, indent=2 if pretty else None).encode()
+        with open(tmp, "wb") as f:
+            f.write(raw)  # compact by default: the file is machine-read
+        os.replace(tmp, PATH)  # atomic: readers never see a half-written file
+        _CACHE = d
+        _MTIME = os.stat(PATH).st_mtime
+
+# known-bad tokens re-probe sooner than good ones age out
+NEG_TTL = float(os.getenv("OG_TAX_NEG_TTL", "3600"))
 
 def get(chain, token, router, ttl_sec=86400):
     d = load(); k = f"{chain}:{token.lower()}:{router.lower()}"; v = d.get(k)
-    if v and time.time() - v.get("ts", 0) < ttl_sec:
+    if not v:
+        return None
+    ttl = NEG_TTL if v.get("negative") else ttl_sec
+    if time.time() - v.get("ts", 0) < ttl:
         return v
 
 def put(chain, token, router, payload):
-    d = load(); k = f"{chain}:{token.lower()}:{router.lower()}"; payload = dict(payload); payload["ts"] = time.time(); d[k] = payload; save(d)
+    with _LOCK:
+        d = load(); k = f"{chain}:{token.lower()}:{router.lower()}"; payload = dict(payload); payload["ts"] = time.time(); d[k] = payload; save(d)
+
+def put_negative(chain, token, router):
+    put(chain, token, router, {"honeypot_buy": True, "honeypot_sell": True, "negative": True})
@@ -8,18 +8,50 @@ amounts against ``getAmountsOut`` expectations.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
+import sys
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 from eth_account import Account
 from web3 import Web3
 
-from ..config import CHAIN_CONFIGS, PK
+from ..config import CHAIN_CONFIGS, MAX_FEE_GWEI, PK, PRIO_FEE_GWEI
 from ..logging_conf import LOGGER
-from ..utils import now_deadline, retry_call
-from .abi_fragments import ERC20, ROUTER
-from .cache import get as cache_get, put as cache_put
+from ..scanner.multicall import aggregate3
+from ..scanner.pairs import rpc_batch_call
+from ..utils import json_dumps, now_deadline, retry_call
+from ..web3_pool import get_w3
+from . import simulate_probe
+from .abi_fragments import DECIMALS_CALLDATA, ERC20, ROUTER, SYMBOL_CALLDATA, balance_of_calldata
+from .cache import get as cache_get, put as cache_put, put_negative as cache_put_negative
+
+
+@functools.lru_cache(maxsize=None)
+def _router_contract(chain: str):
+    cfg = CHAIN_CONFIGS[chain]
+    return get_w3(chain).eth.contract(address=cfg.router, abi=ROUTER)
+
+
+@functools.lru_cache(maxsize=512)
+def _erc20(chain: str, addr: str):
+    return get_w3(chain).eth.contract(address=addr, abi=ERC20)
+
+
+# sizing guess for pipelined sells: the sell amount must be chosen before the
+# buy lands, so assume up to this much buy tax and sell what must survive it
+_ASSUMED_BUY_TAX = 0.30
+
+
+def _emit(result: dict) -> None:
+    """Pretty-print for humans, one compact line for pipes and batch runs."""
+    if sys.stdout.isatty():
+        print(json.dumps(result, indent=2))
+    else:
+        sys.stdout.write(json_dumps(result).decode() + "\n")
 
 
 def main(
@@ -28,10 +60,19 @@ def main(
     dust: float = float(os.getenv("DUST_BASE", "0.0002")),
     dry_run: bool = False,
     force_probe: bool = False,
+    live: bool = False,
+    quiet: bool = False,
 ) -> Any:
-    """Execute small buy/sell swaps and estimate token taxes."""
+    """Estimate token taxes, preferring a read-only eth_call simulation.
+
+    The default path simulates the dust buy/sell via state-overridden
+    ``eth_call`` (no gas, no receipts); pass ``live=True`` — or run against
+    a provider without override support — to fall back to real swaps.
+    """
 
     cfg = CHAIN_CONFIGS[chain]
+    # poll receipts a few times per block instead of web3's generic 0.1s
+    poll_latency = max(0.5, cfg.block_time / 3)
 
     if dry_run:
         result = {
@@ -50,19 +91,38 @@ def main(
             "tx_sell": None,
             "dry_run": True,
         }
-        print(json.dumps(result, indent=2))
+        if not quiet:
+            _emit(result)
         return result
 
-    w3 = Web3(Web3.HTTPProvider(cfg.rpc))
-    router_c = w3.eth.contract(address=cfg.router, abi=ROUTER)
-
     if not force_probe:
         cached = cache_get(chain, token, cfg.router)
         if cached:
             cached.pop("ts", None)
-            print(json.dumps(cached, indent=2))
+            if cached.get("negative"):
+                LOGGER.warning("token %s cached as honeypot; skipping probe", token)
+            if not quiet:
+                _emit(cached)
             return cached
 
+    if not live:
+        sim = simulate_probe.estimate(chain, token, dust)
+        if sim is not None:
+            if not force_probe:
+                cache_put(chain, token, cfg.router, sim)
+            if not quiet:
+                _emit(sim)
+            return sim
+        LOGGER.warning("simulated probe unavailable; falling back to live swaps")
+
+    # shared provider (pooled session keep-alive) + memoized contracts
+    w3 = get_w3(chain)
+    router_c = _router_contract(chain)
+
+    # fee caps converted to wei once per probe rather than per transaction
+    max_fee = w3.to_wei(MAX_FEE_GWEI, "gwei")
+    prio_fee = w3.to_wei(PRIO_FEE_GWEI, "gwei")
+
     if not PK:
         raise SystemExit("PK is not set. Put a DUST-ONLY key in .env (PK=0x...)")
     acct = Account.from_key(PK)
@@ -70,126 +130,225 @@ def main(
     weth = cfg.wrapped
 
     def erc20(addr: str):
-        return w3.eth.contract(address=addr, abi=ERC20)
-
-    def approve(token_addr: str, spender: str, amount: int) -> None:
-        tx_args = {
-            "from": me,
-            "nonce": w3.eth.get_transaction_count(me),
-            "maxFeePerGas": w3.to_wei(float(os.getenv("MAX_FEE_GWEI", "15")), "gwei"),
-            "maxPriorityFeePerGas": w3.to_wei(float(os.getenv("PRIO_FEE_GWEI", "1.5")), "gwei"),
-            "gas": 80_000,
-        }
-        try:
-            tx = erc20(token_addr).functions.approve(spender, amount).build_transaction(tx_args)
+        return _erc20(chain, addr)
+
+    def approve(token_addr: str, spender: str, amount: int, nonce: int) -> int:
+        """Send an approve at ``nonce`` and return the next free nonce.
+
+        Nonces are tracked locally (fetched once in ``main``) so approvals
+        no longer cost a ``get_transaction_count`` round-trip each — and the
+        reset-to-zero fallback gets its own nonce instead of reusing one.
+        """
+
+        def _send(amt: int, n: int) -> None:
+            tx = erc20(token_addr).functions.approve(spender, amt).build_transaction(
+                {
+                    "from": me,
+                    "nonce": n,
+                    "maxFeePerGas": max_fee,
+                    "maxPriorityFeePerGas": prio_fee,
+                    "gas": 80_000,
+                }
+            )
             signed = w3.eth.account.sign_transaction(tx, PK)
             h = w3.eth.send_raw_transaction(signed.rawTransaction)
-            w3.eth.wait_for_transaction_receipt(h, timeout=120)
+            w3.eth.wait_for_transaction_receipt(h, timeout=120, poll_latency=poll_latency)
+
+        try:
+            _send(amount, nonce)
+            return nonce + 1
         except Exception:
-            tx0 = erc20(token_addr).functions.approve(spender, 0).build_transaction(tx_args)
-            signed0 = w3.eth.account.sign_transaction(tx0, PK)
-            h0 = w3.eth.send_raw_transaction(signed0.rawTransaction)
-            w3.eth.wait_for_transaction_receipt(h0, timeout=120)
-            tx1 = erc20(token_addr).functions.approve(spender, amount).build_transaction(tx_args)
-            signed1 = w3.eth.account.sign_transaction(tx1, PK)
-            h1 = w3.eth.send_raw_transaction(signed1.rawTransaction)
-            w3.eth.wait_for_transaction_receipt(h1, timeout=120)
+            # some tokens demand resetting the allowance to zero first
+            _send(0, nonce)
+            _send(amount, nonce + 1)
+            return nonce + 2
 
     token_c = erc20(token)
-    try:
-        symbol = token_c.functions.symbol().call()
-    except Exception as e:
-        LOGGER.warning("symbol failed: %s", e)
-        symbol = ""
-    try:
-        decimals = token_c.functions.decimals().call()
-    except Exception as e:
-        LOGGER.warning("decimals failed: %s", e)
-        decimals = 18
 
-    if w3.eth.chain_id in (56, 1) and dust <= 0.0:
+    # computed exactly once via Decimal so e.g. dust=0.0002 does not pick up
+    # float dust (wrapped base assumed 18 dec); every later site reuses this
+    amount_in = int(Decimal(str(dust)) * Decimal(10**18))
+    if amount_in <= 0:
         raise SystemExit("dust must be > 0")
 
-    amount_in = int(dust * 10**18)  # wrapped base assumed 18 dec
-
+    # fold the independent pre-swap reads into one JSON-RPC batch (the
+    # installed web3 has no batch_requests); any batch problem falls back
+    # to the original serial calls with their per-call degradation
+    # quote_ok separates "router answered zero" (dead pair, honeypot verdict)
+    # from "quote never reached the router" (RPC blip, keep probing)
+    symbol, decimals, expected_buy, quote_ok = "", 18, 0, False
     try:
-        expected_buy = retry_call(3, lambda: router_c.functions.getAmountsOut(amount_in, [weth, token]).call())[-1]
-    except Exception as e:  # pragma: no cover - network dependent
-        LOGGER.warning("getAmountsOut failed: %s", e)
-        expected_buy = 0
-
-    # approve router to spend wrapped base and token
-    approve(weth, cfg.router, amount_in)
-
-    nonce = w3.eth.get_transaction_count(me)
-    tx_buy = router_c.functions.swapExactTokensForTokensSupportingFeeOnTransferTokens(
-        amount_in, 0, [weth, token], me, now_deadline(3)
-    ).build_transaction(
-        {
-            "from": me,
-            "nonce": nonce,
-            "maxFeePerGas": w3.to_wei(float(os.getenv("MAX_FEE_GWEI", "15")), "gwei"),
-            "maxPriorityFeePerGas": w3.to_wei(
-                float(os.getenv("PRIO_FEE_GWEI", "1.5")), "gwei"
-            ),
-            "gas": 350_000,
+        raw = rpc_batch_call(
+            chain,
+            [
+                (token, SYMBOL_CALLDATA),
+                (token, DECIMALS_CALLDATA),
+                (cfg.router, router_c.encodeABI(fn_name="getAmountsOut", args=[amount_in, [weth, token]])),
+            ],
+        )
+        symbol = w3.codec.decode(["string"], raw[0])[0]
+        decimals = w3.codec.decode(["uint8"], raw[1])[0]
+        expected_buy = w3.codec.decode(["uint256[]"], raw[2])[0][-1]
+        quote_ok = True
+    except Exception as batch_exc:  # pragma: no cover - provider dependent
+        LOGGER.debug("batch pre-swap reads failed (%s); going serial", batch_exc)
+        try:
+            symbol = token_c.functions.symbol().call()
+        except Exception as e:
+            LOGGER.warning("symbol failed: %s", e)
+        try:
+            decimals = token_c.functions.decimals().call()
+        except Exception as e:
+            LOGGER.warning("decimals failed: %s", e)
+        try:
+            expected_buy = retry_call(3, lambda: router_c.functions.getAmountsOut(amount_in, [weth, token]).call())[-1]
+            quote_ok = True
+        except Exception as e:  # pragma: no cover - network dependent
+            LOGGER.warning("getAmountsOut failed: %s", e)
+
+    if quote_ok and not expected_buy:
+        # the router itself quoted zero — a dead or unroutable pair; sending
+        # the approve and swap would only burn gas to prove the same thing.
+        # Cache the negative verdict so repeat probes cost zero RPCs until it
+        # expires.  A quote that never got through is NOT a verdict: the probe
+        # continues on the serialized path instead of mislabeling the token.
+        LOGGER.warning("no buy quote for %s; recording honeypot without swapping", token)
+        result = {
+            "token": Web3.to_checksum_address(token),
+            "router": cfg.router,
+            "symbol": symbol,
+            "decimals": decimals,
+            "buy_tax_est": 0.0,
+            "sell_tax_est": 0.0,
+            "honeypot_buy": True,
+            "honeypot_sell": True,
+            "expected_buy": "0",
+            "got_tokens": "0",
+            "got_weth": "0",
+            "tx_buy": None,
+            "tx_sell": None,
+            "dry_run": False,
         }
-    )
-    signed_buy = w3.eth.account.sign_transaction(tx_buy, PK)
-    rcpt_buy = w3.eth.wait_for_transaction_receipt(
-        w3.eth.send_raw_transaction(signed_buy.rawTransaction), timeout=180
-    )
+        if not force_probe:
+            cache_put_negative(chain, token, cfg.router)
+        if not quiet:
+            _emit(result)
+        return result
 
-    bal_tok_after = token_c.functions.balanceOf(me).call()
-    got_tok = bal_tok_after  # assume zero balance before
+    # one nonce fetch for the whole probe; incremented locally per tx
+    nonce = w3.eth.get_transaction_count(me, "pending")
+    weth_c = erc20(weth)
 
-    buy_tax_est = 0.0
-    if expected_buy and got_tok:
-        shortfall = max(expected_buy - got_tok, 0)
-        buy_tax_est = min(shortfall / max(expected_buy, 1), 0.99)
-    honeypot_buy = got_tok == 0
+    def _signed_swap(amount: int, path: list[str], n: int):
+        tx = router_c.functions.swapExactTokensForTokensSupportingFeeOnTransferTokens(
+            amount, 0, path, me, now_deadline(3)
+        ).build_transaction(
+            {
+                "from": me,
+                "nonce": n,
+                "maxFeePerGas": max_fee,
+                "maxPriorityFeePerGas": prio_fee,
+                "gas": 350_000,
+            }
+        )
+        return w3.eth.account.sign_transaction(tx, PK)
 
-    weth_bal = erc20(weth).functions.balanceOf(me).call()
-    if weth_bal < int(dust * 10**18):
-        raise SystemExit("Insufficient WETH/WBNB for dust probe. Wrap first or lower DUST_BASE")
+    def _balances() -> tuple[int, int]:
+        """Token and wrapped-base balances of ``me`` in one eth_call.
 
-    sell_amt = int(got_tok * 0.8)
-    if sell_amt == 0:
-        honeypot_sell = True
-        got_weth = 0
-        rcpt_sell = None
-        expected_sell = 0
-    else:
-        approve(token, cfg.router, sell_amt)
+        Both reads ride a single Multicall3 aggregate, so each balance
+        snapshot costs one RPC instead of two; a JSON-RPC batch and then
+        plain serial calls remain as fallbacks for thin providers.
+        """
+        bal_cd = balance_of_calldata(me)
+        try:
+            res = aggregate3(w3, [(token, bal_cd), (weth, bal_cd)])
+            if all(ok for ok, _ in res):
+                return int.from_bytes(res[0][1], "big"), int.from_bytes(res[1][1], "big")
+        except Exception:  # pragma: no cover - provider dependent
+            pass
+        try:
+            raw = rpc_batch_call(chain, [(token, bal_cd), (weth, bal_cd)])
+            return int.from_bytes(raw[0], "big"), int.from_bytes(raw[1], "big")
+        except Exception:  # pragma: no cover - provider dependent
+            return token_c.functions.balanceOf(me).call(), weth_c.functions.balanceOf(me).call()
+
+    pipelined = os.getenv("OG_PROBE_PIPELINED", "1") == "1" and expected_buy > 0
+    if pipelined:
+        # submit buy (nonce n) and sell (nonce n+1) back-to-back and wait on
+        # the sell only: the chain cannot mine it before the buy, so one
+        # receipt covers both and the probe pays one block wait instead of
+        # two.  The sell is sized from the quote with the assumed-tax haircut
+        # because the real buy proceeds are unknown at submit time.
+        tok_before, weth_before = _balances()
+        if weth_before < amount_in:
+            raise SystemExit("Insufficient WETH/WBNB for dust probe. Wrap first or lower DUST_BASE")
+
+        sell_amt = int(expected_buy * (1 - _ASSUMED_BUY_TAX) * 0.8)
+        nonce = approve(weth, cfg.router, amount_in, nonce)
+        nonce = approve(token, cfg.router, sell_amt, nonce)
         try:
             expected_sell = retry_call(3, lambda: router_c.functions.getAmountsOut(sell_amt, [token, weth]).call())[-1]
         except Exception as e:
             LOGGER.warning("getAmountsOut failed: %s", e)
             expected_sell = 0
 
-        bal_weth_before = erc20(weth).functions.balanceOf(me).call()
-        nonce += 1
-        tx_sell = router_c.functions.swapExactTokensForTokensSupportingFeeOnTransferTokens(
-            sell_amt, 0, [token, weth], me, now_deadline(3)
-        ).build_transaction(
-            {
-                "from": me,
-                "nonce": nonce,
-                "maxFeePerGas": w3.to_wei(float(os.getenv("MAX_FEE_GWEI", "15")), "gwei"),
-                "maxPriorityFeePerGas": w3.to_wei(
-                    float(os.getenv("PRIO_FEE_GWEI", "1.5")), "gwei"
-                ),
-                "gas": 350_000,
-            }
-        )
-        signed_sell = w3.eth.account.sign_transaction(tx_sell, PK)
-        rcpt_sell = w3.eth.wait_for_transaction_receipt(
-            w3.eth.send_raw_transaction(signed_sell.rawTransaction), timeout=180
+        buy_hash = w3.eth.send_raw_transaction(_signed_swap(amount_in, [weth, token], nonce).rawTransaction)
+        sell_hash = w3.eth.send_raw_transaction(_signed_swap(sell_amt, [token, weth], nonce + 1).rawTransaction)
+        rcpt_sell = w3.eth.wait_for_transaction_receipt(sell_hash, timeout=180, poll_latency=poll_latency)
+        rcpt_buy = w3.eth.get_transaction_receipt(buy_hash)
+
+        tok_after, weth_after = _balances()
+        sold = sell_amt if rcpt_sell.status else 0
+        got_tok = max(tok_after - tok_before, 0) + sold
+        spent = amount_in if rcpt_buy.status else 0
+        got_weth = max(weth_after + spent - weth_before, 0)
+        honeypot_sell = not rcpt_sell.status or got_weth == 0
+    else:
+        # serialized path (OG_PROBE_PIPELINED=0 or no usable quote): wait out
+        # the buy receipt, then size the sell from the balance it delivered
+        nonce = approve(weth, cfg.router, amount_in, nonce)
+        rcpt_buy = w3.eth.wait_for_transaction_receipt(
+            w3.eth.send_raw_transaction(_signed_swap(amount_in, [weth, token], nonce).rawTransaction),
+            timeout=180,
+            poll_latency=poll_latency,
         )
+        nonce += 1
 
-        bal_weth_after = erc20(weth).functions.balanceOf(me).call()
-        got_weth = max(bal_weth_after - bal_weth_before, 0)
-        honeypot_sell = got_weth == 0
+        got_tok, weth_bal = _balances()
+        if weth_bal < amount_in:
+            raise SystemExit("Insufficient WETH/WBNB for dust probe. Wrap first or lower DUST_BASE")
+
+        sell_amt = int(got_tok * 0.8)
+        if sell_amt == 0:
+            honeypot_sell = True
+            got_weth = 0
+            rcpt_sell = None
+            expected_sell = 0
+        else:
+            nonce = approve(token, cfg.router, sell_amt, nonce)
+            try:
+                expected_sell = retry_call(3, lambda: router_c.functions.getAmountsOut(sell_amt, [token, weth]).call())[-1]
+            except Exception as e:
+                LOGGER.warning("getAmountsOut failed: %s", e)
+                expected_sell = 0
+
+            # nothing has landed since the post-buy batch read
+            bal_weth_before = weth_bal
+            rcpt_sell = w3.eth.wait_for_transaction_receipt(
+                w3.eth.send_raw_transaction(_signed_swap(sell_amt, [token, weth], nonce).rawTransaction),
+                timeout=180,
+                poll_latency=poll_latency,
+            )
+            bal_weth_after = weth_c.functions.balanceOf(me).call()
+            got_weth = max(bal_weth_after - bal_weth_before, 0)
+            honeypot_sell = got_weth == 0
+
+    buy_tax_est = 0.0
+    if expected_buy and got_tok:
+        shortfall = max(expected_buy - got_tok, 0)
+        buy_tax_est = min(shortfall / max(expected_buy, 1), 0.99)
+    honeypot_buy = got_tok == 0
 
     sell_tax_est = 0.0
     if expected_sell and got_weth:
@@ -216,10 +375,40 @@ def main(
     if not force_probe:
         cache_put(chain, token, cfg.router, result)
 
-    print(json.dumps(result, indent=2))
+    if not quiet:
+        _emit(result)
     return result
 
 
+def probe_many(
+    chain: str,
+    tokens: list[str],
+    dust: float = float(os.getenv("DUST_BASE", "0.0002")),
+    max_workers: int = 8,
+) -> dict[str, Any]:
+    """Probe several tokens concurrently; returns ``{token: result or None}``.
+
+    A probe is >90% waiting on RPC round-trips, so overlapping them scales
+    throughput roughly with the worker count.  Cache writes are serialized
+    by the lock in :mod:`oldgold.tax.cache`.  Note that live (non-cached)
+    probes send transactions from the same account, so heavy concurrency is
+    most useful when the bulk of tokens resolve from the cache.
+    """
+
+    results: dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        # results come back through the dict; per-token stdout is skipped
+        futures = {ex.submit(main, chain=chain, token=t, dust=dust, quiet=True): t for t in tokens}
+        for fut in as_completed(futures):
+            t = futures[fut]
+            try:
+                results[t] = fut.result()
+            except (Exception, SystemExit) as e:  # pragma: no cover - network dependent
+                LOGGER.warning("probe failed for %s: %s", t, e)
+                results[t] = None
+    return results
+
+
 def cli() -> None:  # pragma: no cover
     p = argparse.ArgumentParser()
     p.add_argument("--chain", default="bsc")
@@ -227,8 +416,9 @@ def cli() -> None:  # pragma: no cover
     p.add_argument("--dust", type=float, default=float(os.getenv("DUST_BASE", "0.0002")))
     p.add_argument("--dry-run", action="store_true")
     p.add_argument("--force-probe", action="store_true")
+    p.add_argument("--live", action="store_true", help="send real dust swaps instead of simulating")
     args = p.parse_args()
-    main(chain=args.chain, token=args.token, dust=args.dust, dry_run=args.dry_run, force_probe=args.force_probe)
+    main(chain=args.chain, token=args.token, dust=args.dust, dry_run=args.dry_run, force_probe=args.force_probe, live=args.live)
 
 
 if __name__ == "__main__":  # pragma: no cover
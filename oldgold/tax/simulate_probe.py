@@ -0,0 +1,195 @@
+"""Read-only tax probe via ``eth_call`` with state overrides.
+
+The live probe sends real dust swaps and waits for receipts — the most
+expensive operation available, gated by block time.  The estimate itself
+only needs the swap *effects*, which a node can compute in a single
+``eth_call``: the buy and sell are routed through Multicall3 so several
+calls execute atomically in one simulation, and a state override hands
+the aggregator a fake wrapped-base balance plus router allowance so no
+funds or gas are ever required.
+
+Two simulations are made: one to discover how many tokens the dust buy
+yields, and a replay that appends the sell of 80% of that amount —
+mirroring the live probe's sequencing so tax estimates stay comparable.
+Providers without state-override support make the functions return
+``None`` and callers fall back to the live path.
+"""
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, List, Tuple
+
+from eth_utils import keccak
+from web3 import Web3
+
+from ..config import CHAIN_CONFIGS
+from ..logging_conf import LOGGER
+from ..utils import now_deadline
+from ..web3_pool import get_w3
+from .abi_fragments import DECIMALS_CALLDATA, ERC20, ROUTER, SYMBOL_CALLDATA, balance_of_calldata
+
+# WETH9-style storage layout (WBNB is a byte-for-byte copy): the balanceOf
+# mapping lives in slot 3 and allowance in slot 4.
+_BALANCE_SLOT = 3
+_ALLOWANCE_SLOT = 4
+# plenty for any dust probe without looking like an overflow
+_FAKE_BALANCE = 10**24
+
+_MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+
+def _pad_addr(addr: str) -> bytes:
+    return bytes.fromhex(addr[2:]).rjust(32, b"\x00")
+
+
+def _override_for(cfg) -> dict:
+    """State override giving Multicall3 wrapped-base funds and allowance."""
+
+    bal_slot = keccak(_pad_addr(_MULTICALL3) + _BALANCE_SLOT.to_bytes(32, "big"))
+    allow_inner = keccak(_pad_addr(_MULTICALL3) + _ALLOWANCE_SLOT.to_bytes(32, "big"))
+    allow_slot = keccak(_pad_addr(cfg.router) + allow_inner)
+    value = "0x" + _FAKE_BALANCE.to_bytes(32, "big").hex()
+    return {
+        cfg.wrapped: {
+            "stateDiff": {
+                "0x" + bal_slot.hex(): value,
+                "0x" + allow_slot.hex(): value,
+            }
+        }
+    }
+
+
+def _simulate(w3: Web3, calls: List[Tuple[str, bytes]], override: dict) -> List[Tuple[bool, bytes]]:
+    """Run ``(target, calldata)`` pairs atomically in one overridden eth_call."""
+
+    from ..scanner.multicall import MULTICALL3_ABI
+
+    mc = w3.eth.contract(address=Web3.to_checksum_address(_MULTICALL3), abi=MULTICALL3_ABI)
+    data = mc.encodeABI(
+        fn_name="aggregate3",
+        args=[[(Web3.to_checksum_address(t), True, cd) for t, cd in calls]],
+    )
+    raw = w3.eth.call({"to": mc.address, "data": data}, "latest", override)
+    return [(bool(ok), bytes(out)) for ok, out in w3.codec.decode(["(bool,bytes)[]"], raw)[0]]
+
+
+def _uint(w3: Web3, ok: bool, raw: bytes) -> int:
+    return int(w3.codec.decode(["uint256"], raw)[0]) if ok and len(raw) >= 32 else 0
+
+
+def estimate(chain: str, token: str, dust: float) -> dict[str, Any] | None:
+    """Estimate buy/sell taxes for ``token`` without sending transactions.
+
+    Returns the same estimate fields as the live probe (plus symbol and
+    decimals) or ``None`` when the simulation is unavailable so callers can
+    fall back to real swaps.
+    """
+
+    cfg = CHAIN_CONFIGS[chain]
+    w3 = get_w3(chain)
+    token = Web3.to_checksum_address(token)
+    weth = cfg.wrapped
+    mc_addr = Web3.to_checksum_address(_MULTICALL3)
+    router_c = w3.eth.contract(address=cfg.router, abi=ROUTER)
+    token_c = w3.eth.contract(address=token, abi=ERC20)
+
+    amount_in = int(Decimal(str(dust)) * Decimal(10**18))
+    deadline = now_deadline(3)
+    override = _override_for(cfg)
+
+    swap_buy = router_c.encodeABI(
+        fn_name="swapExactTokensForTokensSupportingFeeOnTransferTokens",
+        args=[amount_in, 0, [weth, token], mc_addr, deadline],
+    )
+    # same calldata queries the aggregator's balance on token and weth alike
+    bal_cd = balance_of_calldata(mc_addr)
+
+    try:
+        res = _simulate(
+            w3,
+            [
+                (token, SYMBOL_CALLDATA),
+                (token, DECIMALS_CALLDATA),
+                (cfg.router, router_c.encodeABI(fn_name="getAmountsOut", args=[amount_in, [weth, token]])),
+                (cfg.router, swap_buy),
+                (token, bal_cd),
+            ],
+            override,
+        )
+    except Exception as e:
+        LOGGER.debug("simulated probe unavailable on %s: %s", chain, e)
+        return None
+
+    symbol = w3.codec.decode(["string"], res[0][1])[0] if res[0][0] else ""
+    decimals = int(w3.codec.decode(["uint8"], res[1][1])[0]) if res[1][0] else 18
+    expected_buy = (
+        int(w3.codec.decode(["uint256[]"], res[2][1])[0][-1]) if res[2][0] else 0
+    )
+    got_tok = _uint(w3, *res[4])
+    honeypot_buy = (not res[3][0]) or got_tok == 0
+
+    buy_tax_est = 0.0
+    if expected_buy and got_tok:
+        buy_tax_est = min(max(expected_buy - got_tok, 0) / max(expected_buy, 1), 0.99)
+
+    result = {
+        "token": token,
+        "router": cfg.router,
+        "symbol": symbol,
+        "decimals": decimals,
+        "buy_tax_est": float(buy_tax_est),
+        "sell_tax_est": 0.0,
+        "honeypot_buy": bool(honeypot_buy),
+        "honeypot_sell": True,
+        "expected_buy": str(expected_buy),
+        "got_tokens": str(got_tok),
+        "got_weth": "0",
+        "tx_buy": None,
+        "tx_sell": None,
+        "dry_run": False,
+        "simulated": True,
+    }
+
+    sell_amt = int(got_tok * 0.8)
+    if sell_amt == 0:
+        return result
+
+    # replay the buy and append the sell so it runs against post-buy reserves,
+    # exactly like the live probe's second transaction
+    swap_sell = router_c.encodeABI(
+        fn_name="swapExactTokensForTokensSupportingFeeOnTransferTokens",
+        args=[sell_amt, 0, [token, weth], mc_addr, deadline],
+    )
+    try:
+        res2 = _simulate(
+            w3,
+            [
+                (cfg.router, swap_buy),
+                (token, token_c.encodeABI(fn_name="approve", args=[cfg.router, 2**256 - 1])),
+                (cfg.router, router_c.encodeABI(fn_name="getAmountsOut", args=[sell_amt, [token, weth]])),
+                (weth, bal_cd),
+                (cfg.router, swap_sell),
+                (weth, bal_cd),
+            ],
+            override,
+        )
+    except Exception as e:
+        LOGGER.debug("simulated sell replay failed on %s: %s", chain, e)
+        return None
+
+    expected_sell = (
+        int(w3.codec.decode(["uint256[]"], res2[2][1])[0][-1]) if res2[2][0] else 0
+    )
+    weth_before = _uint(w3, *res2[3])
+    weth_after = _uint(w3, *res2[5])
+    got_weth = max(weth_after - weth_before, 0)
+    honeypot_sell = (not res2[4][0]) or got_weth == 0
+
+    sell_tax_est = 0.0
+    if expected_sell and got_weth:
+        sell_tax_est = min(max(expected_sell - got_weth, 0) / max(expected_sell, 1), 0.99)
+
+    result["sell_tax_est"] = float(sell_tax_est)
+    result["honeypot_sell"] = bool(honeypot_sell)
+    result["got_weth"] = str(got_weth)
+    return result
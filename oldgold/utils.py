@@ -2,22 +2,66 @@
 from __future__ import annotations
 
 import json
+import random
 import time
+from pathlib import Path
 from typing import Any, Callable, TypeVar
 
+import requests
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
 T = TypeVar("T")
 
 
 def load_json(path: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
     with open(path) as f:
         return json.load(f)
 
 
 def save_json(path: str, data: Any) -> None:
+    if orjson is not None:
+        # OPT_SERIALIZE_NUMPY lets callers hand over NumPy scalars/arrays
+        # without a .tolist() pass first
+        Path(path).write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+        return
     with open(path, "w") as f:
         json.dump(data, f, indent=2)
 
 
+def json_dumps(data: Any) -> bytes:
+    """Compact JSON bytes via orjson when available (NumPy-aware)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def append_jsonl(path: str, data: Any) -> None:
+    """Append one JSON line; flushed per row so progress survives crashes."""
+    if orjson is not None:
+        line = orjson.dumps(data) + b"\n"
+    else:
+        line = (json.dumps(data) + "\n").encode()
+    with open(path, "ab") as f:
+        f.write(line)
+        f.flush()
+
+
+def load_jsonl(path: str) -> list:
+    """Read a JSONL file back into a list of objects."""
+    with open(path, "rb") as f:
+        if orjson is not None:
+            return [orjson.loads(line) for line in f if line.strip()]
+        return [json.loads(line) for line in f if line.strip()]
+
+
 def now_deadline(minutes: float) -> int:
     """Return unix timestamp minutes from now."""
     return int(time.time() + minutes * 60)
@@ -31,23 +75,55 @@ def wei_to_eth(wei: int) -> float:
     return wei / 10**18
 
 
-def retry(times: int, func: Callable[[], T]) -> T:
-    """Very small retry helper."""
-    last_err = None
-    for _ in range(times):
-        try:
-            return func()
-        except Exception as e:  # pragma: no cover - simple util
-            last_err = e
-            time.sleep(0.5)
-    raise last_err
+# transient-by-default: network flaps and 5xx-style provider hiccups
+RETRYABLE = (requests.Timeout, requests.ConnectionError, RuntimeError)
+
 
+def _is_retryable(exc: Exception, retryable: tuple) -> bool:
+    if isinstance(exc, requests.HTTPError):
+        # 4xx means the request itself is bad and will never succeed;
+        # 429 (rate limit) and 5xx are worth another shot
+        status = getattr(exc.response, "status_code", None)
+        return status is None or status == 429 or status >= 500
+    return isinstance(exc, retryable)
 
-def retry_call(n: int, fn: Callable[[], T], delay: float = 0.3) -> T:
-    for i in range(n):
+
+def _backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Decorrelated jittered backoff: uniform over ``[base, base*3*2**i]``.
+
+    The fully random window (rather than a jitter factor around a fixed
+    schedule) spreads concurrent retriers out, so workers tripping the same
+    rate limit do not wake in lockstep, while the lower bound keeps the
+    common single-retry case fast.
+    """
+
+    return min(cap, random.uniform(base, base * 3 * (2**attempt)))
+
+
+def retry(
+    times: int,
+    func: Callable[[], T],
+    *,
+    base: float = 0.1,
+    cap: float = 4.0,
+    retryable: tuple = RETRYABLE,
+) -> T:
+    """Retry ``func`` with decorrelated jittered backoff.
+
+    Sleep intervals come from :func:`_backoff_delay`.  Exceptions outside
+    ``retryable`` (including HTTP 4xx other than 429) re-raise immediately —
+    those are deterministic failures and retrying them only adds latency.
+    """
+
+    for i in range(times):
         try:
-            return fn()
-        except Exception:
-            if i == n - 1:
+            return func()
+        except Exception as e:
+            if i == times - 1 or not _is_retryable(e, retryable):
                 raise
-            time.sleep(delay * (2**i))
+            time.sleep(_backoff_delay(i, base, cap))
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
+def retry_call(n: int, fn: Callable[[], T], delay: float = 0.3, retryable: tuple = RETRYABLE) -> T:
+    return retry(n, fn, base=delay, retryable=retryable)
@@ -0,0 +1,28 @@
+"""Shared, memoized Web3 providers.
+
+Building ``Web3(HTTPProvider(...))`` is pure CPU overhead when done per
+call, and a fresh provider means a fresh TCP/TLS handshake on the first
+request.  Modules should fetch providers from here so each chain gets one
+instance backed by a pooled ``requests.Session`` that keeps connections
+alive across calls.
+"""
+from __future__ import annotations
+
+import functools
+
+import requests
+from web3 import Web3
+
+from .config import CHAIN_CONFIGS
+
+
+@functools.lru_cache(maxsize=None)
+def get_w3(chain: str) -> Web3:
+    """Return the process-wide Web3 instance for ``chain``."""
+
+    cfg = CHAIN_CONFIGS[chain]
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return Web3(Web3.HTTPProvider(cfg.rpc, session=session))
@@ -16,3 +16,21 @@ def test_monotonic_increasing():
     a1 = amount_out_v2(10, 1000, 500, 0.003, 0.0)
     a2 = amount_out_v2(20, 1000, 500, 0.003, 0.0)
     assert a2 > a1
+
+
+def test_buy_cost_round_trip():
+    # spending the closed-form cost on the pool must yield the target back
+    # (the buy tax is taken from the received tokens)
+    fee, buy_tax = 0.003, 0.05
+    for target in (1.0, 123.4, 4000.0):
+        cost = buy_cost_on_active_pool(target, 10_000.0, 5_000.0, fee, buy_tax)
+        eff_in = cost * (1 - fee)
+        received = (eff_in * 10_000.0) / (5_000.0 + eff_in)
+        assert received * (1 - buy_tax) == pytest.approx(target, rel=1e-12)
+
+
+def test_buy_cost_infeasible_saturates():
+    # targets at/over the pool's token reserve can never be filled; the cost
+    # saturates instead of raising so grid sweeps stay total
+    cost = buy_cost_on_active_pool(10_000.0, 10_000.0, 5_000.0, 0.003, 0.0)
+    assert cost == 5_000.0 * 1e6